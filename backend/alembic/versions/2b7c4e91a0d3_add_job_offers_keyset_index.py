@@ -0,0 +1,28 @@
+"""add job_offers keyset pagination index
+
+Revision ID: 2b7c4e91a0d3
+Revises: 6f9f6835eaf3
+Create Date: 2025-08-14 10:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7c4e91a0d3'
+down_revision: Union[str, Sequence[str], None] = '6f9f6835eaf3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_job_offers_created_at_id', 'job_offers', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_offers_created_at_id', table_name='job_offers')
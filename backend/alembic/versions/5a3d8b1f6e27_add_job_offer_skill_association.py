@@ -0,0 +1,70 @@
+"""add job_offer_skill_association
+
+Revision ID: 5a3d8b1f6e27
+Revises: e1f07a3b9c52
+Create Date: 2025-08-20 11:48:19.631045
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a3d8b1f6e27'
+down_revision: Union[str, Sequence[str], None] = 'e1f07a3b9c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _split_technologies(value):
+    if not value:
+        return set()
+    try:
+        items = json.loads(value)
+    except ValueError:
+        items = value.split(",")
+    if not isinstance(items, list):
+        items = [str(items)]
+    return {str(item).strip().strip('"[]').strip().lower() for item in items} - {""}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    association = op.create_table('job_offer_skill_association',
+    sa.Column('job_offer_id', sa.Integer(), nullable=False),
+    sa.Column('skill_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['job_offer_id'], ['job_offers.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['skill_id'], ['skills.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_offer_id', 'skill_id')
+    )
+    op.create_index('ix_job_offer_skill_association_skill_id_job_offer_id', 'job_offer_skill_association', ['skill_id', 'job_offer_id'], unique=False)
+
+    # Backfill from the free-text technologies_matched column
+    conn = op.get_bind()
+    skill_ids = {name.lower(): skill_id for skill_id, name in conn.execute(sa.text("SELECT id, name FROM skills"))}
+    offers = conn.execute(sa.text(
+        "SELECT id, technologies_matched FROM job_offers WHERE technologies_matched IS NOT NULL"
+    ))
+    rows = []
+    for offer_id, technologies in offers:
+        rows.extend(
+            {"job_offer_id": offer_id, "skill_id": skill_ids[name]}
+            for name in _split_technologies(technologies)
+            if name in skill_ids
+        )
+        if len(rows) >= BATCH_SIZE:
+            op.bulk_insert(association, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(association, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_offer_skill_association_skill_id_job_offer_id', table_name='job_offer_skill_association')
+    op.drop_table('job_offer_skill_association')
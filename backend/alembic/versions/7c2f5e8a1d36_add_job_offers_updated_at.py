@@ -0,0 +1,29 @@
+"""add job_offers.updated_at
+
+Revision ID: 7c2f5e8a1d36
+Revises: 3e8f1a6c9d40
+Create Date: 2025-08-27 09:41:12.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2f5e8a1d36'
+down_revision: Union[str, Sequence[str], None] = '3e8f1a6c9d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_offers', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE job_offers SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('job_offers', 'updated_at')
@@ -0,0 +1,36 @@
+"""scope job_offers feed index by user
+
+Revision ID: 8d1e5f3c27b4
+Revises: 2b7c4e91a0d3
+Create Date: 2025-08-15 09:47:03.162870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d1e5f3c27b4'
+down_revision: Union[str, Sequence[str], None] = '2b7c4e91a0d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_job_offers_user_id_created_at_id',
+        'job_offers',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    # Every feed query is now scoped by user_id, which leads the new index
+    op.drop_index('ix_job_offers_created_at_id', table_name='job_offers')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_job_offers_created_at_id', 'job_offers', ['created_at', 'id'], unique=False)
+    op.drop_index('ix_job_offers_user_id_created_at_id', table_name='job_offers')
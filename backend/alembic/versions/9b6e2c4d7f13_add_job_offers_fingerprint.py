@@ -0,0 +1,74 @@
+"""add job_offers fingerprint
+
+Revision ID: 9b6e2c4d7f13
+Revises: 5a3d8b1f6e27
+Create Date: 2025-08-22 13:26:54.807731
+
+"""
+import hashlib
+import re
+from typing import Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b6e2c4d7f13'
+down_revision: Union[str, Sequence[str], None] = '5a3d8b1f6e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRACKING_PARAMS = re.compile(r"^(utm_.*|trk.*|ref|refid|trackingid|src|source|gclid|fbclid)$", re.IGNORECASE)
+
+
+def _normalize_text(value):
+    return " ".join(re.sub(r"[^\w\s]", " ", (value or "").lower()).split())
+
+
+def _normalize_link(value):
+    if not value:
+        return ""
+    parts = urlsplit(value.strip())
+    query = sorted((k, v) for k, v in parse_qsl(parts.query) if not TRACKING_PARAMS.match(k))
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), urlencode(query), ""
+    ))
+
+
+def _fingerprint(title, company, location, apply_link):
+    key = "\x1f".join((
+        _normalize_text(title), _normalize_text(company), _normalize_text(location), _normalize_link(apply_link)
+    ))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_offers', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+
+    # Backfill the oldest copy of each vacancy. Later copies keep a NULL
+    # fingerprint so the unique index can be built without deleting rows.
+    conn = op.get_bind()
+    seen = set()
+    updates = []
+    offers = conn.execute(sa.text(
+        "SELECT id, user_id, title, company, location, apply_link FROM job_offers ORDER BY id"
+    )).all()
+    for offer_id, user_id, title, company, location, apply_link in offers:
+        fingerprint = _fingerprint(title, company, location, apply_link)
+        if (user_id, fingerprint) in seen:
+            continue
+        seen.add((user_id, fingerprint))
+        updates.append({"id": offer_id, "fingerprint": fingerprint})
+    if updates:
+        conn.execute(sa.text("UPDATE job_offers SET fingerprint = :fingerprint WHERE id = :id"), updates)
+
+    op.create_index('uq_job_offers_user_id_fingerprint', 'job_offers', ['user_id', 'fingerprint'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_job_offers_user_id_fingerprint', table_name='job_offers')
+    op.drop_column('job_offers', 'fingerprint')
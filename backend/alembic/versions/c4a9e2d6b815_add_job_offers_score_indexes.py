@@ -0,0 +1,42 @@
+"""add job_offers score and high match indexes
+
+Revision ID: c4a9e2d6b815
+Revises: 8d1e5f3c27b4
+Create Date: 2025-08-16 14:05:27.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a9e2d6b815'
+down_revision: Union[str, Sequence[str], None] = '8d1e5f3c27b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_job_offers_user_id_score',
+        'job_offers',
+        ['user_id', sa.text('match_score DESC'), sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_job_offers_high_match',
+        'job_offers',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('match_score >= 0.7'),
+        sqlite_where=sa.text('match_score >= 0.7'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_offers_high_match', table_name='job_offers')
+    op.drop_index('ix_job_offers_user_id_score', table_name='job_offers')
@@ -0,0 +1,52 @@
+"""add job_offers full text search
+
+Revision ID: e1f07a3b9c52
+Revises: c4a9e2d6b815
+Create Date: 2025-08-18 16:31:52.270158
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f07a3b9c52'
+down_revision: Union[str, Sequence[str], None] = 'c4a9e2d6b815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(reason, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE job_offers_fts USING fts5(title, description, reason)")
+        op.execute(
+            "INSERT INTO job_offers_fts (rowid, title, description, reason) "
+            "SELECT id, title, description, reason FROM job_offers"
+        )
+        return
+    # Generated column: backfilled on add, maintained by Postgres on every insert/update
+    op.execute(
+        "ALTER TABLE job_offers ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    )
+    op.create_index(
+        'ix_job_offers_search_vector', 'job_offers', ['search_vector'], unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE job_offers_fts")
+        return
+    op.drop_index('ix_job_offers_search_vector', table_name='job_offers', postgresql_using='gin')
+    op.drop_column('job_offers', 'search_vector')
@@ -4,6 +4,7 @@ Authentication router module.
 This module contains all authentication-related routes including JWT auth,
 user registration, Google OAuth, and refresh token functionality.
 """
+import logging
 import os
 from fastapi import APIRouter
 from jose import JWTError, jwt
@@ -23,6 +24,7 @@ from fastapi import Request, Form
 from fastapi import APIRouter
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 SECRET = os.getenv("SECRET_KEY", " ")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
@@ -46,7 +48,7 @@ async def custom_jwt_login(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     strategy: JWTStrategy = auth_backend.get_strategy()  # type: ignore
     access_token = await strategy.write_token(user)
-    print(f"Access token generated for user {user.id} - {access_token}")
+    logger.info("Access token generated for user %s", user.id)
     refresh_token = create_refresh_token(user)
     return {
         "access": access_token,
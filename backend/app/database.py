@@ -3,12 +3,22 @@ Database configuration and session management for the FastAPI application.
 
 This module contains database connection setup and session management utilities.
 """
+import logging
 import os
+import time
 from typing import AsyncGenerator
 from urllib.parse import quote_plus
 
+import redis
+from cachetools import TTLCache
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app import metrics, redis_client
+
+logger = logging.getLogger(__name__)
 
 DB_ENGINE = os.getenv("DB_ENGINE", "postgresql")
 DB_NAME = os.getenv("DB_NAME", "dbname")
@@ -19,13 +29,69 @@ DB_PORT = os.getenv("DB_PORT", "5432")
 
 DATABASE_URL = f"{DB_ENGINE}+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# Optional read replica; read-only handlers fall back to the primary without it
+DB_REPLICA_HOST = os.getenv("DB_REPLICA_HOST")
+DB_REPLICA_PORT = os.getenv("DB_REPLICA_PORT", DB_PORT)
+REPLICA_DATABASE_URL = (
+    f"{DB_ENGINE}+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_REPLICA_HOST}:{DB_REPLICA_PORT}/{DB_NAME}"
+    if DB_REPLICA_HOST else None
+)
+# How long a user's reads stay on the primary after they write
+DB_REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", 5))
+
+# Pool tuning; defaults match SQLAlchemy's except for recycle and pre-ping
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() in ("1", "true", "yes")
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
 
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            metrics.DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def _create_engine(url: str, poolclass=AsyncAdaptedQueuePool):
+    return create_async_engine(
+        url,
+        echo=DB_ECHO,
+        poolclass=poolclass,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args={"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE},
+    )
+
+
 # Async engine
-engine = create_async_engine(DATABASE_URL, echo=False)
+engine = _create_engine(DATABASE_URL, poolclass=InstrumentedPool)
+replica_engine = _create_engine(REPLICA_DATABASE_URL) if REPLICA_DATABASE_URL else None
+
+metrics.DB_POOL_SIZE.set_function(lambda: engine.pool.size())
+metrics.DB_POOL_CHECKED_OUT.set_function(lambda: engine.pool.checkedout())
+metrics.DB_POOL_CHECKED_IN.set_function(lambda: engine.pool.checkedin())
+metrics.DB_POOL_OVERFLOW.set_function(lambda: max(engine.pool.overflow(), 0))
+metrics.instrument_engine(engine)
+if replica_engine is not None:
+    metrics.instrument_engine(replica_engine)
 
 # Async sessionmaker
 AsyncSessionLocal = async_sessionmaker(
@@ -34,6 +100,51 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Read-only sessionmaker, bound to the replica when one is configured
+ReplicaSessionLocal = async_sessionmaker(
+    bind=replica_engine or engine,
+    expire_on_commit=False,
+)
+
+# Read-your-writes markers live in Redis so every worker and instance sees them;
+# the local cache only saves the writing process a round trip
+RECENT_WRITE_KEY = "recent_write:{}"
+_recent_writers: TTLCache = TTLCache(maxsize=100_000, ttl=DB_REPLICA_STICKY_SECONDS)
+
+
+async def mark_user_write(*user_ids: int | None) -> None:
+    """Pin these users' reads to the primary until replication has caught up."""
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+    if not user_ids or replica_engine is None:
+        return
+    for user_id in user_ids:
+        _recent_writers[user_id] = True
+    try:
+        async with redis_client.redis_client.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.set(RECENT_WRITE_KEY.format(user_id), 1, px=int(DB_REPLICA_STICKY_SECONDS * 1000))
+            await pipe.execute()
+    except (redis.RedisError, OSError) as exc:
+        logger.warning("Could not record writes by users %s: %s", user_ids, exc)
+
+
+async def read_sessionmaker_for(user_id: int | None) -> async_sessionmaker:
+    """Return the sessionmaker a read-only request by ``user_id`` should use.
+
+    Falls back to the primary when Redis cannot say whether the user just wrote.
+    """
+    if replica_engine is None or user_id in _recent_writers:
+        return AsyncSessionLocal
+    if user_id is None:
+        return ReplicaSessionLocal
+    try:
+        recently_wrote = await redis_client.redis_client.exists(RECENT_WRITE_KEY.format(user_id))
+    except (redis.RedisError, OSError) as exc:
+        logger.warning("Could not check recent writes by user %s: %s", user_id, exc)
+        return AsyncSessionLocal
+    return AsyncSessionLocal if recently_wrote else ReplicaSessionLocal
+
+
 # Dependency
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Database session dependency for FastAPI."""
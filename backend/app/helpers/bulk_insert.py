@@ -0,0 +1,145 @@
+"""
+Set-based, idempotent insert path for job offers.
+
+Rows go to the database as multi-row ``INSERT ... VALUES ... RETURNING``
+statements, one per chunk, so a batch of N offers costs ``ceil(N / chunk)``
+round trips instead of N + 1.
+
+Each offer carries a content fingerprint (normalized title, company, location
+and apply link). Offers whose ``(user_id, fingerprint)`` already exists are
+merged into the existing row instead of being inserted again, so repeated
+Gmail polls, recruiters and LinkedIn all converge on one row per vacancy.
+"""
+import hashlib
+import os
+import re
+from datetime import datetime
+from typing import Any, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy import case, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models
+
+BULK_CREATE_CHUNK_SIZE = int(os.getenv("BULK_CREATE_CHUNK_SIZE", 1000))
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = re.compile(r"^(utm_.*|trk.*|ref|refid|trackingid|src|source|gclid|fbclid)$", re.IGNORECASE)
+
+# Fields refreshed from the newest analysis when an offer is merged
+MERGED_TEXT_FIELDS = ("email", "reason", "technologies_matched", "description")
+
+
+def dialect_insert(db: AsyncSession, target):
+    """Return an ``insert()`` for ``target`` that supports ON CONFLICT."""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(target)
+    return postgresql_insert(target)
+
+
+def _normalize_text(value: str | None) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", (value or "").lower()).split())
+
+
+def _normalize_link(value: str | None) -> str:
+    if not value:
+        return ""
+    parts = urlsplit(value.strip())
+    query = sorted((k, v) for k, v in parse_qsl(parts.query) if not TRACKING_PARAMS.match(k))
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), urlencode(query), ""
+    ))
+
+
+def job_offer_fingerprint(row: dict[str, Any]) -> str:
+    """Hash the fields that identify a vacancy, ignoring case, punctuation and tracking params."""
+    key = "\x1f".join((
+        _normalize_text(row.get("title")),
+        _normalize_text(row.get("company")),
+        _normalize_text(row.get("location")),
+        _normalize_link(row.get("apply_link")),
+    ))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _merge_rows(existing: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(existing)
+    for field in MERGED_TEXT_FIELDS:
+        if new.get(field) is not None and not (field == "email" and new[field] == ""):
+            merged[field] = new[field]
+    scores = [s for s in (existing.get("match_score"), new.get("match_score")) if s is not None]
+    if scores:
+        merged["match_score"] = max(scores)
+    return merged
+
+
+async def bulk_insert_job_offers(
+    db: AsyncSession,
+    rows: Sequence[dict[str, Any]],
+    chunk_size: int = BULK_CREATE_CHUNK_SIZE,
+) -> list[models.JobOffer]:
+    """Upsert ``rows`` on ``(user_id, fingerprint)`` and return the offers in input order.
+
+    ``rows`` must carry their ``fingerprint`` and must not contain two entries with the same key.
+    """
+    table = models.JobOffer.__table__
+    stmt = dialect_insert(db, models.JobOffer)
+    set_ = {field: func.coalesce(stmt.excluded[field], table.c[field]) for field in MERGED_TEXT_FIELDS}
+    # Rows without an email get the column default '', which must not blank a stored address
+    set_["email"] = func.coalesce(func.nullif(stmt.excluded.email, ""), table.c.email)
+    set_["match_score"] = case(
+        (stmt.excluded.match_score > table.c.match_score, stmt.excluded.match_score),
+        else_=func.coalesce(table.c.match_score, stmt.excluded.match_score),
+    )
+    set_["updated_at"] = datetime.utcnow()
+    # Ordered RETURNING would make SQLAlchemy send an upsert one row at a time,
+    # so rows come back in any order and are matched to the input by key
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.fingerprint], set_=set_
+    ).returning(models.JobOffer)
+
+    by_key: dict[tuple[Any, str], models.JobOffer] = {}
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        result = await db.scalars(
+            stmt,
+            chunk,
+            execution_options={"insertmanyvalues_page_size": chunk_size, "populate_existing": True},
+        )
+        by_key.update(((offer.user_id, offer.fingerprint), offer) for offer in result.all())
+    return [by_key[(row.get("user_id"), row["fingerprint"])] for row in rows]
+
+
+async def ingest_job_offers(
+    db: AsyncSession,
+    rows: Sequence[dict[str, Any]],
+    chunk_size: int = BULK_CREATE_CHUNK_SIZE,
+) -> tuple[list[models.JobOffer], int, int]:
+    """Fingerprint, deduplicate and upsert ``rows``.
+
+    Returns ``(offers, inserted, merged)`` where ``offers`` holds one entry per
+    distinct vacancy and ``merged`` counts rows folded into an existing one,
+    whether already stored or repeated within ``rows``.
+    """
+    unique: dict[tuple[Any, str], dict[str, Any]] = {}
+    for row in rows:
+        fingerprint = job_offer_fingerprint(row)
+        key = (row.get("user_id"), fingerprint)
+        unique[key] = _merge_rows(unique[key], row) if key in unique else {**row, "fingerprint": fingerprint}
+
+    keys = [key for key in unique if key[0] is not None]
+    existing = set()
+    for start in range(0, len(keys), chunk_size):
+        result = await db.execute(
+            select(models.JobOffer.user_id, models.JobOffer.fingerprint)
+            .where(tuple_(models.JobOffer.user_id, models.JobOffer.fingerprint).in_(keys[start:start + chunk_size]))
+        )
+        existing.update(tuple(row) for row in result.all())
+
+    offers = await bulk_insert_job_offers(db, list(unique.values()), chunk_size)
+    inserted = len(unique) - len(existing)
+    return offers, inserted, len(rows) - inserted
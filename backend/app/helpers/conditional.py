@@ -0,0 +1,47 @@
+"""
+Validators for conditional GETs on list endpoints.
+
+Feed pages get a weak ETag derived from what identifies their content (the
+query, the total and each row's id, sort key and ``updated_at``) so an
+unchanged page can be answered with ``304 Not Modified`` before it is
+serialized.
+"""
+import hashlib
+from typing import Any, Iterable, Sequence
+
+from fastapi import Request, Response
+
+FEED_CACHE_CONTROL = "private, no-cache"
+
+
+def weak_etag(*parts: Any) -> str:
+    """Return a weak ETag hashing the ``repr`` of ``parts``."""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def page_etag(request: Request, user_id: int, total: int, rows: Sequence[Any], keys: Iterable[Any]) -> str:
+    """ETag for one page of ``rows``, identified by their ids and the column ``keys``."""
+    names = [key.key for key in keys]
+    return weak_etag(
+        user_id,
+        request.url.path,
+        request.url.query,
+        total,
+        [(row.id, *(getattr(row, name) for name in names)) for row in rows],
+    )
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """True when ``If-None-Match`` matches ``etag`` under weak comparison."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": FEED_CACHE_CONTROL})
@@ -0,0 +1,26 @@
+"""
+Change notifications for the background services.
+
+The API publishes small JSON messages on Redis pub/sub channels so services
+that cache API data (e.g. the digest generator's tech stacks) can drop stale
+entries. Delivery is best-effort: a Redis outage must never fail the request
+that made the change, and subscribers bound staleness with their own TTLs.
+"""
+import json
+import logging
+
+import redis
+
+from app import redis_client
+
+logger = logging.getLogger(__name__)
+
+USER_SKILLS_UPDATED_CHANNEL = "user_skills_updated"
+
+
+async def publish_user_skills_updated(*user_ids: int) -> None:
+    """Announce that the tech stacks of ``user_ids`` changed."""
+    try:
+        await redis_client.redis_client.publish(USER_SKILLS_UPDATED_CHANNEL, json.dumps(sorted(set(user_ids))))
+    except (redis.RedisError, OSError) as exc:
+        logger.warning("Could not publish user skills update for %s: %s", user_ids, exc)
@@ -0,0 +1,22 @@
+"""
+Normalization of user-supplied list filters before they reach SQL.
+"""
+from datetime import datetime, timezone
+
+LIKE_ESCAPE = "\\"
+
+
+def naive_utc(value: datetime | None) -> datetime | None:
+    """Convert an aware datetime to naive UTC, matching the ``DateTime`` columns.
+
+    asyncpg refuses to compare aware values with ``timestamp without time zone``.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def contains_pattern(value: str) -> str:
+    """``LIKE`` pattern matching ``value`` literally anywhere; use with ``escape=LIKE_ESCAPE``."""
+    escaped = value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace("%", LIKE_ESCAPE + "%").replace("_", LIKE_ESCAPE + "_")
+    return f"%{escaped}%"
@@ -0,0 +1,69 @@
+"""
+Link job offers to catalog skills.
+
+The digest generator reports matched technologies as free text; this module
+resolves them against ``models.Skill`` (case-insensitively) and stores one
+``job_offer_skill_association`` row per match so skill queries hit an index.
+"""
+import json
+from typing import Any, Sequence
+
+from sqlalchemy import delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models
+from app.helpers.bulk_insert import BULK_CREATE_CHUNK_SIZE, dialect_insert
+
+
+def split_technologies(value: str | None) -> list[str]:
+    """Split a ``technologies_matched`` value into distinct, trimmed names.
+
+    Accepts comma-separated text as well as a JSON list serialized to text.
+    """
+    if not value:
+        return []
+    try:
+        items = json.loads(value)
+    except ValueError:
+        items = value.split(",")
+    if not isinstance(items, list):
+        items = [str(items)]
+    names = {}
+    for item in items:
+        name = str(item).strip().strip('"[]').strip()
+        if name:
+            names.setdefault(name.lower(), name)
+    return list(names.values())
+
+
+async def link_job_offer_skills(db: AsyncSession, offers: Sequence[Any]) -> None:
+    """Replace the skill links of flushed ``offers`` with their current ``technologies_matched``.
+
+    Merged offers may have dropped technologies, so their old links are
+    deleted first; for newly inserted offers the delete matches nothing.
+    Runs in the caller's transaction.
+    """
+    wanted = {o.id: {n.lower() for n in split_technologies(o.technologies_matched)} for o in offers}
+    offer_ids = list(wanted)
+    assoc = models.job_offer_skill_association
+    for start in range(0, len(offer_ids), BULK_CREATE_CHUNK_SIZE):
+        await db.execute(delete(assoc).where(assoc.c.job_offer_id.in_(offer_ids[start:start + BULK_CREATE_CHUNK_SIZE])))
+
+    names = set().union(*wanted.values()) if wanted else set()
+    if not names:
+        return
+
+    result = await db.execute(
+        select(func.lower(models.Skill.name), models.Skill.id)
+        .where(func.lower(models.Skill.name).in_(names))
+    )
+    skill_ids = dict(result.all())
+    rows = [
+        {"job_offer_id": offer_id, "skill_id": skill_ids[name]}
+        for offer_id, offer_names in wanted.items()
+        for name in offer_names
+        if name in skill_ids
+    ]
+    if rows:
+        await db.execute(dialect_insert(db, assoc), rows)
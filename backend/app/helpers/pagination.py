@@ -0,0 +1,83 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque url-safe tokens that encode the sort key of the boundary
+row and the direction to page in, so every page is an index range scan no
+matter how deep the client has scrolled.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+def encode_cursor(values: Sequence[Any], direction: str) -> str:
+    """Encode sort key ``values`` and ``direction`` as an opaque token."""
+    raw = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    data = json.dumps([raw, direction], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> tuple[list[Any], str]:
+    """Decode a token produced by ``encode_cursor`` for the given sort ``keys``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw, direction = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in (NEXT, PREVIOUS) or len(raw) != len(keys):
+            raise ValueError("cursor does not match sort keys")
+        values = [
+            datetime.fromisoformat(v) if key.type.python_type is datetime else key.type.python_type(v)
+            for key, v in zip(keys, raw)
+        ]
+        return values, direction
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+async def paginate_keyset(
+    db: AsyncSession,
+    stmt: Select,
+    keys: Sequence[Any],
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[Any], str | None, str | None]:
+    """Fetch one page of ``stmt`` ordered by ``keys`` descending.
+
+    Returns ``(rows, next_cursor, previous_cursor)``. ``keys`` must end with a
+    unique column so the ordering is total.
+    """
+    direction = NEXT
+    if cursor:
+        values, direction = decode_cursor(cursor, keys)
+        boundary = tuple_(*keys)
+        stmt = stmt.where(boundary < tuple_(*values) if direction == NEXT else boundary > tuple_(*values))
+
+    if direction == NEXT:
+        stmt = stmt.order_by(*(key.desc() for key in keys))
+    else:
+        stmt = stmt.order_by(*(key.asc() for key in keys))
+
+    rows = list((await db.execute(stmt.limit(limit + 1))).scalars().all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if direction == PREVIOUS:
+        rows.reverse()
+
+    if not rows:
+        return rows, None, None
+
+    def key_of(row):
+        return [getattr(row, key.key) for key in keys]
+
+    has_next = has_more if direction == NEXT else True
+    has_previous = bool(cursor) if direction == NEXT else has_more
+    next_cursor = encode_cursor(key_of(rows[-1]), NEXT) if has_next else None
+    previous_cursor = encode_cursor(key_of(rows[0]), PREVIOUS) if has_previous else None
+    return rows, next_cursor, previous_cursor
@@ -0,0 +1,95 @@
+"""
+Full-text search over job offer title, description and reason.
+
+Postgres keeps a stored, weighted ``tsvector`` column with a GIN index that the
+database maintains itself. SQLite (local development) falls back to an FTS5
+table keyed by job offer id, which the write paths keep in sync explicitly.
+Both are created alongside ``job_offers`` in ``app.models``.
+"""
+import re
+from typing import Any, Sequence
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models
+
+SEARCH_CONFIG = models.SEARCH_CONFIG
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=24, MinWords=8"
+
+_fts = table("job_offers_fts", column("rowid"), column("title"), column("description"), column("reason"))
+
+
+def _dialect(db: AsyncSession) -> str:
+    return db.get_bind().dialect.name
+
+
+def _fts5_query(q: str) -> str:
+    """Turn free text into an FTS5 query that ANDs every quoted term."""
+    return " ".join(f'"{term}"' for term in re.findall(r"\w+", q))
+
+
+async def index_job_offers(db: AsyncSession, offers: Sequence[Any]) -> None:
+    """Add or refresh flushed job offers in the search index.
+
+    A no-op on Postgres, where the generated ``search_vector`` column is
+    maintained by the database on insert and update.
+    """
+    if _dialect(db) != "sqlite" or not offers:
+        return
+    await remove_from_search_index(db, [o.id for o in offers])
+    await db.execute(
+        _fts.insert(),
+        [
+            {"rowid": o.id, "title": o.title, "description": o.description, "reason": o.reason}
+            for o in offers
+        ],
+    )
+
+
+async def remove_from_search_index(db: AsyncSession, job_offer_ids: Sequence[int]) -> None:
+    """Drop deleted job offers from the search index (SQLite only)."""
+    if _dialect(db) != "sqlite" or not job_offer_ids:
+        return
+    await db.execute(_fts.delete().where(_fts.c.rowid.in_(job_offer_ids)))
+
+
+async def search_job_offers(db: AsyncSession, user_id: int, q: str, limit: int) -> list[tuple[Any, float, str]]:
+    """Return ``(job_offer, rank, highlight)`` for the best matches of ``q``.
+
+    Higher ranks are better. Highlights wrap matched terms in ``<mark>``.
+    """
+    if _dialect(db) == "sqlite":
+        fts_query = _fts5_query(q)
+        if not fts_query:
+            return []
+        rank = (-func.bm25(literal_column("job_offers_fts"), 10.0, 4.0, 1.0)).label("rank")
+        highlight = func.snippet(literal_column("job_offers_fts"), -1, "<mark>", "</mark>", "…", 24).label("highlight")
+        stmt = (
+            select(models.JobOffer, rank, highlight)
+            .join(_fts, _fts.c.rowid == models.JobOffer.id)
+            .where(literal_column("job_offers_fts").op("MATCH")(fts_query), models.JobOffer.user_id == user_id)
+            .order_by(rank.desc(), models.JobOffer.id.desc())
+            .limit(limit)
+        )
+        return [tuple(row) for row in (await db.execute(stmt)).all()]
+
+    query = func.websearch_to_tsquery(text(f"'{SEARCH_CONFIG}'"), q)
+    vector = literal_column("job_offers.search_vector")
+    rank = func.ts_rank_cd(vector, query).label("rank")
+    # Rank and limit first so ts_headline only runs on the rows we return
+    top = (
+        select(models.JobOffer.id, rank)
+        .where(models.JobOffer.user_id == user_id, vector.op("@@")(query))
+        .order_by(rank.desc(), models.JobOffer.id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    document = func.concat_ws(" — ", models.JobOffer.title, models.JobOffer.reason, models.JobOffer.description)
+    highlight = func.ts_headline(text(f"'{SEARCH_CONFIG}'"), document, query, HEADLINE_OPTIONS).label("highlight")
+    stmt = (
+        select(models.JobOffer, top.c.rank, highlight)
+        .join(top, top.c.id == models.JobOffer.id)
+        .order_by(top.c.rank.desc(), models.JobOffer.id.desc())
+    )
+    return [tuple(row) for row in (await db.execute(stmt)).all()]
@@ -0,0 +1,61 @@
+"""
+Fast JSON rendering for job offer list endpoints.
+
+Returning a Pydantic page from a handler costs two validation passes (the
+handler's ``model_validate`` and FastAPI's ``response_model`` check) before the
+stdlib encoder runs. The ORM rows are already trusted, so list endpoints copy
+the ``JobOfferBase`` fields straight into dicts and render them with orjson.
+The routes keep ``response_model`` for the OpenAPI schema only.
+
+The feed can also be projected to a subset of fields (``view=summary`` or
+``fields=``) so scrolling clients skip the large text columns entirely.
+"""
+from typing import Any, Iterable, Sequence
+
+from fastapi import HTTPException
+
+from fastapi.responses import ORJSONResponse
+
+from app.schemas.schemas import JobOfferBase
+
+JOB_OFFER_FIELDS = tuple(JobOfferBase.model_fields)
+# What the app's feed cards show
+JOB_OFFER_SUMMARY_FIELDS = ("id", "title", "company", "location", "match_score", "created_at")
+
+
+def job_offer_fields(view: str, fields: str | None) -> tuple[str, ...]:
+    """Resolve the ``view``/``fields`` query parameters to the fields to return.
+
+    ``fields`` is a comma-separated list and wins over ``view``; ``id`` is
+    always included.
+    """
+    if fields is None:
+        return JOB_OFFER_SUMMARY_FIELDS if view == "summary" else JOB_OFFER_FIELDS
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested.difference(JOB_OFFER_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(f for f in JOB_OFFER_FIELDS if f in requested or f == "id")
+
+
+def job_offer_dict(offer: Any, fields: Iterable[str] = JOB_OFFER_FIELDS) -> dict[str, Any]:
+    """Copy the public ``JobOfferBase`` fields of an ORM row into a dict."""
+    return {field: getattr(offer, field) for field in fields}
+
+
+def job_offer_page_response(
+    count: int,
+    next_url: str | None,
+    previous_url: str | None,
+    offers: Sequence[Any],
+    fields: Iterable[str] = JOB_OFFER_FIELDS,
+    headers: dict[str, str] | None = None,
+) -> ORJSONResponse:
+    """Render a ``JobOfferPage`` without re-validating each offer."""
+    fields = tuple(fields)
+    return ORJSONResponse({
+        "count": count,
+        "next": next_url,
+        "previous": previous_url,
+        "results": [job_offer_dict(o, fields) for o in offers],
+    }, headers=headers)
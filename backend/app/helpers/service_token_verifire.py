@@ -1,16 +1,51 @@
+import hashlib
+import os
+import time
+
+from cachetools import LRUCache
 from fastapi import Depends, HTTPException, status, Request
 from jose import jwt, JWTError
 from services.service_auth.config import JWT_SECRET, JWT_ALGORITHM
 
+# Workers reuse a handful of tokens for an hour, so remember the ones already verified
+SERVICE_TOKEN_CACHE_SIZE = int(os.getenv("SERVICE_TOKEN_CACHE_SIZE", 1024))
+
+_verified_tokens: LRUCache | None = LRUCache(maxsize=SERVICE_TOKEN_CACHE_SIZE) if SERVICE_TOKEN_CACHE_SIZE else None
+
+
+def decode_service_token(token: str) -> dict:
+    """Verify ``token`` and return its payload, reusing earlier results until ``exp``.
+
+    Raises ``JWTError`` for invalid or expired tokens. Only tokens that passed
+    signature verification are cached, keyed by their SHA-256 digest. Callers
+    get their own copy of the payload, so mutating it cannot leak into later
+    requests carrying the same token.
+    """
+    if _verified_tokens is None:
+        return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = _verified_tokens.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at is None or time.time() < expires_at:
+            return dict(payload)
+        del _verified_tokens[key]
+
+    payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    _verified_tokens[key] = (payload.get("exp"), payload)
+    return dict(payload)
+
+
 def verify_service_token(request: Request):
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid token")
     token = auth_header.split(" ")[1]
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = decode_service_token(token)
         if payload.get("scope") != "service":
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid token scope")
         return payload
     except JWTError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
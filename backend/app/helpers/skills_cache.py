@@ -0,0 +1,90 @@
+"""
+In-process cache of the skills catalog.
+
+The catalog is a few hundred rows that change only when ``import_skills.py``
+runs or a skill is written. Writers bump the ``skills`` row in
+``catalog_versions``; readers serve the cached, pre-serialized catalog and
+only look at that version (one primary-key lookup) every
+``SKILLS_CACHE_CHECK_SECONDS``.
+"""
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models
+from app.helpers.bulk_insert import dialect_insert
+
+SKILLS_CATALOG = "skills"
+SKILLS_CACHE_CHECK_SECONDS = float(os.getenv("SKILLS_CACHE_CHECK_SECONDS", 30))
+
+
+@dataclass
+class SkillsCatalog:
+    version: int
+    etag: str
+    body: bytes
+    by_id: dict[int, dict] = field(default_factory=dict)
+
+
+_catalog: SkillsCatalog | None = None
+_checked_at = 0.0
+_lock = asyncio.Lock()
+
+
+async def _current_version(db: AsyncSession) -> int:
+    result = await db.execute(
+        select(models.CatalogVersion.version).where(models.CatalogVersion.name == SKILLS_CATALOG)
+    )
+    return result.scalar() or 0
+
+
+async def _load(db: AsyncSession, version: int) -> SkillsCatalog:
+    result = await db.execute(select(models.Skill.id, models.Skill.name).order_by(models.Skill.id))
+    skills = [{"name": name, "id": skill_id} for skill_id, name in result.all()]
+    return SkillsCatalog(
+        version=version,
+        etag=f'"skills-v{version}"',
+        body=json.dumps(skills, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        by_id={skill["id"]: skill for skill in skills},
+    )
+
+
+async def get_skills_catalog(db: AsyncSession) -> SkillsCatalog:
+    """Return the cached catalog, reloading it if the stored version moved on."""
+    global _catalog, _checked_at
+    if _catalog is not None and time.monotonic() - _checked_at < SKILLS_CACHE_CHECK_SECONDS:
+        return _catalog
+    async with _lock:
+        if _catalog is None or time.monotonic() - _checked_at >= SKILLS_CACHE_CHECK_SECONDS:
+            version = await _current_version(db)
+            if _catalog is None or _catalog.version != version:
+                _catalog = await _load(db, version)
+            _checked_at = time.monotonic()
+    return _catalog
+
+
+def _invalidate(session=None) -> None:
+    global _catalog, _checked_at
+    _catalog = None
+    _checked_at = 0.0
+
+
+async def bump_skills_version(db: AsyncSession) -> None:
+    """Mark the catalog as changed. Call inside the transaction that writes skills.
+
+    This process drops its cached catalog once that transaction commits;
+    clearing it earlier would let a concurrent request reload the old catalog
+    and keep serving it for a whole check interval.
+    """
+    stmt = dialect_insert(db, models.CatalogVersion).values(name=SKILLS_CATALOG, version=1)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[models.CatalogVersion.name],
+        set_={"version": models.CatalogVersion.version + 1},
+    ))
+    event.listen(db.sync_session, "after_commit", _invalidate, once=True)
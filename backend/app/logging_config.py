@@ -0,0 +1,116 @@
+"""
+Logging profiles for the API.
+
+``LOG_PROFILE=development`` (the default) keeps plain, synchronous DEBUG
+output on stderr. ``LOG_PROFILE=production`` emits one JSON object per line
+and hands records to a ``QueueListener`` thread, so formatting and file I/O
+never run on the event loop. Records are redacted before they are queued and
+written to size-rotated ``logs/logging_info.log`` / ``logs/logging_error.log``.
+"""
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import re
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_PROFILE = os.getenv("LOG_PROFILE", "development")
+PRODUCTION = LOG_PROFILE == "production"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO" if PRODUCTION else "DEBUG").upper()
+LOG_DIR = os.getenv("LOG_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs"))
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 10 * 1024 * 1024))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", 5))
+
+# Attributes every LogRecord has; anything else was passed via ``extra=``
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+REDACTED = "[REDACTED]"
+SECRET_PATTERNS = (
+    re.compile(r"(?i)(bearer\s+)[\w\-.~+/]+=*"),
+    re.compile(r"\beyJ[\w-]+\.[\w-]+\.[\w-]*"),  # JWTs
+    re.compile(r"(?i)((?:password|secret|token|refresh|access|api[_-]?key)[\"']?\s*[:=]\s*[\"']?)[^\s\"',&}]+"),
+)
+
+
+def redact(text: str) -> str:
+    for pattern in SECRET_PATTERNS:
+        text = pattern.sub(lambda m: (m.group(1) if m.groups() else "") + REDACTED, text)
+    return text
+
+
+class RedactingFilter(logging.Filter):
+    """Scrub tokens, passwords and secrets from the rendered message."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        redacted = redact(message)
+        if redacted != message:
+            record.msg, record.args = redacted, None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Render a record, including its ``extra`` fields, as one JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update((k, v) for k, v in vars(record).items() if k not in _RECORD_ATTRS)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _JsonQueueHandler(QueueHandler):
+    """Queue copies of records, leaving formatting to the listener thread.
+
+    ``QueueHandler.prepare`` formats the record on the caller's thread and
+    drops ``exc_info``; only the message arguments need resolving here.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging() -> None:
+    """Install the handlers for ``LOG_PROFILE``."""
+    if not PRODUCTION:
+        logging.basicConfig(level=LOG_LEVEL)
+        return
+
+    os.makedirs(LOG_DIR, exist_ok=True)
+    formatter = JsonFormatter()
+    console = logging.StreamHandler()
+    info_file = RotatingFileHandler(
+        os.path.join(LOG_DIR, "logging_info.log"), maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
+    error_file = RotatingFileHandler(
+        os.path.join(LOG_DIR, "logging_error.log"), maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
+    error_file.setLevel(logging.ERROR)
+    for handler in (console, info_file, error_file):
+        handler.setFormatter(formatter)
+
+    queue_handler = _JsonQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(RedactingFilter())
+    listener = QueueListener(queue_handler.queue, console, info_file, error_file, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(LOG_LEVEL)
+    listener.start()
+    atexit.register(listener.stop)
@@ -11,37 +11,37 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 import asyncio
 import time
 from fastapi.middleware.cors import CORSMiddleware
 from app.auth.auth import fastapi_users
 from app.middleware.allowed_hosts import AllowedHostsMiddleware
 from app.middleware.service_token_middleware import ServiceAuthMiddleware
+from app.middleware.request_logging import RequestLoggingMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.logging_config import PRODUCTION, configure_logging
 from app.schemas.schemas import UserRead, UserUpdate
 from app.routes.routes import router
 from app.auth.router import router as auth_router
 from app.routes.service_routes import router as service_routes
 
 
-logging.basicConfig(level=logging.DEBUG)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '').split(
     ',') if os.getenv('ALLOWED_HOSTS') else []
 
-app = FastAPI(debug=True, title="NextJob AI API", version="1.0.0")
-
-
-@app.middleware("http")
-async def log_requests(request, call_next):
-    logger.info("Request: %s %s", request.method, request.url)
-    response = await call_next(request)
-    logger.info("Response: %s", response.status_code)
-    return response
+app = FastAPI(debug=not PRODUCTION, title="NextJob AI API", version="1.0.0")
 
+app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(AllowedHostsMiddleware)
 app.add_middleware(ServiceAuthMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -82,3 +82,9 @@ async def health_async():
     await asyncio.sleep(0)
     duration_ms = (time.perf_counter() - start) * 1000
     return {"status": "ok", "mode": "async", "duration_ms": round(duration_ms, 3)}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus scrape endpoint."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,107 @@
+"""
+Prometheus metrics for the API.
+
+Metrics live in the default ``prometheus_client`` registry and are served in
+text format from ``GET /metrics`` (see ``app.main``). HTTP metrics are recorded
+by ``app.middleware.metrics.MetricsMiddleware``; database statements are timed
+by the engine hooks installed with ``instrument_engine``.
+"""
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+
+# Connection pool
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured number of persistent pool connections")
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Connections currently checked out of the pool")
+DB_POOL_CHECKED_IN = Gauge("db_pool_checked_in", "Idle connections currently held by the pool")
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "Connections open beyond pool_size")
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection, including opening new ones",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that gave up after pool_timeout"
+)
+
+# HTTP, labelled by route template so paths with ids share one series
+UNMATCHED_ROUTE = "<unmatched>"
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to produce a complete response",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "Requests currently being handled", ["method"]
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Response body size",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+
+# Database statements
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Time spent executing a single SQL statement",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed while handling a request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "http_request_db_duration_seconds",
+    "Total SQL execution time while handling a request",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+
+@dataclass
+class QueryStats:
+    """SQL statements run on behalf of the current request."""
+
+    count: int = 0
+    duration: float = 0.0
+
+
+request_query_stats: ContextVar[QueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+def instrument_engine(async_engine) -> None:
+    """Time every statement run through ``async_engine``.
+
+    SQLAlchemy runs async sessions in greenlets that share the caller's
+    context, so the hooks see the ``QueryStats`` of the request being served.
+    """
+    sync_engine = async_engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _finish(conn, cursor, statement, parameters, context, executemany):
+        _record(time.perf_counter() - conn.info["query_start"].pop())
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _failed(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            _record(time.perf_counter() - conn.info["query_start"].pop())
+
+
+def _record(elapsed: float) -> None:
+    DB_QUERY_DURATION.observe(elapsed)
+    stats = request_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
@@ -1,19 +1,27 @@
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
-from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 import os
 
 
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '').split(',') if os.getenv('ALLOWED_HOSTS') else []
 
-class AllowedHostsMiddleware(BaseHTTPMiddleware):
-    """Middleware to restrict access to allowed hosts only."""
+class AllowedHostsMiddleware:
+    """ASGI middleware to restrict access to allowed hosts only."""
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp, allowed_hosts: list[str] | None = None):
+        self.app = app
+        self.allowed_hosts = frozenset(ALLOWED_HOSTS if allowed_hosts is None else allowed_hosts)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Check if the request host is in the allowed hosts list."""
-        host = request.headers.get("host", "").split(":")[0]
-        print(f"Request host: {host}")
-        print(f"Allowed hosts: {ALLOWED_HOSTS}")
-        if host not in ALLOWED_HOSTS:
-            return JSONResponse(status_code=403, content={"detail": "Host not allowed"})
-        return await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        host = Headers(scope=scope).get("host", "").split(":")[0]
+        if host not in self.allowed_hosts:
+            response = JSONResponse(status_code=403, content={"detail": "Host not allowed"})
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
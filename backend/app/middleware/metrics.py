@@ -0,0 +1,47 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import metrics
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, size, in-flight and DB metrics per route."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        stats = metrics.QueryStats()
+        token = metrics.request_query_stats.set(stats)
+        in_progress = metrics.HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            in_progress.dec()
+            metrics.request_query_stats.reset(token)
+            # Label by route template; raw paths of unmatched requests would explode cardinality
+            route = getattr(scope.get("route"), "path", metrics.UNMATCHED_ROUTE)
+            metrics.HTTP_REQUEST_DURATION.labels(method, route, str(status_code)).observe(duration)
+            metrics.HTTP_RESPONSE_SIZE.labels(method, route).observe(response_size)
+            metrics.DB_QUERIES_PER_REQUEST.labels(method, route).observe(stats.count)
+            metrics.DB_TIME_PER_REQUEST.labels(method, route).observe(stats.duration)
@@ -0,0 +1,62 @@
+import logging
+import os
+import random
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.logging_config import PRODUCTION
+
+logger = logging.getLogger(__name__)
+
+# Share of successful requests that get an access log line; production keeps 10% by default
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", 0.1 if PRODUCTION else 1.0))
+# Per-route overrides keyed by route template, e.g. "/health/async=0,/job-offers=0.05"
+ACCESS_LOG_ROUTE_SAMPLE_RATES = {
+    route.strip(): float(rate)
+    for route, _, rate in (
+        item.rpartition("=") for item in os.getenv("ACCESS_LOG_ROUTE_SAMPLE_RATES", "").split(",") if item.strip()
+    )
+}
+# Server errors and requests slower than this are always logged
+ACCESS_LOG_SLOW_MS = float(os.getenv("ACCESS_LOG_SLOW_MS", 1000))
+
+
+class RequestLoggingMiddleware:
+    """ASGI middleware writing one sampled access log line per HTTP request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            # The router stores the matched route in the scope; unmatched paths log as-is
+            route = getattr(scope.get("route"), "path", scope["path"])
+            rate = ACCESS_LOG_ROUTE_SAMPLE_RATES.get(route, ACCESS_LOG_SAMPLE_RATE)
+            if status_code >= 500 or duration_ms >= ACCESS_LOG_SLOW_MS or random.random() < rate:
+                logger.info(
+                    "%s %s %s %.1fms", scope["method"], scope["path"], status_code, duration_ms,
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "route": route,
+                        "status": status_code,
+                        "duration_ms": round(duration_ms, 1),
+                    },
+                )
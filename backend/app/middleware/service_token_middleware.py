@@ -1,33 +1,43 @@
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
-from fastapi import Request
-from jose import jwt, JWTError
-from services.service_auth.config import JWT_SECRET, JWT_ALGORITHM
+from starlette.types import ASGIApp, Receive, Scope, Send
+from jose import JWTError
+from app.helpers.service_token_verifire import decode_service_token
 
 
-class ServiceAuthMiddleware(BaseHTTPMiddleware):
-    """Middleware to protect only /service routes with a service token.
+class ServiceAuthMiddleware:
+    """ASGI middleware to protect only /service routes with a service token.
 
     - Checks Authorization: Bearer <token>
-    - Verifies JWT and requires payload.scope == "service"
+    - Verifies JWT (cached until exp) and requires payload.scope == "service"
     - Skips non-/service paths
     """
 
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-        if path.startswith("/service"):
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                return JSONResponse(status_code=401, content={"detail": "Missing or invalid token"})
-
-            token = auth_header.split(" ", 1)[1]
-            try:
-                payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-                if payload.get("scope") != "service":
-                    return JSONResponse(status_code=403, content={"detail": "Invalid token scope"})
-                # Optionally expose payload to downstream handlers
-                request.state.service_token_payload = payload
-            except JWTError:
-                return JSONResponse(status_code=401, content={"detail": "Invalid token"})
-
-        return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["path"].startswith("/service"):
+            response = self.authenticate(scope)
+            if response is not None:
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+    def authenticate(self, scope: Scope) -> JSONResponse | None:
+        """Return an error response, or ``None`` once the token is accepted."""
+        auth_header = Headers(scope=scope).get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return JSONResponse(status_code=401, content={"detail": "Missing or invalid token"})
+
+        token = auth_header.split(" ", 1)[1]
+        try:
+            payload = decode_service_token(token)
+        except JWTError:
+            return JSONResponse(status_code=401, content={"detail": "Invalid token"})
+        if payload.get("scope") != "service":
+            return JSONResponse(status_code=403, content={"detail": "Invalid token scope"})
+        # Optionally expose payload to downstream handlers (request.state.service_token_payload)
+        scope.setdefault("state", {})["service_token_payload"] = payload
+        return None
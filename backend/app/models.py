@@ -5,18 +5,30 @@ This module contains SQLAlchemy models for users, job offers, skills, and their
 """
 from datetime import datetime
 
-from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, DateTime, Table, Boolean
+from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, DateTime, Table, Boolean, Index, DDL, event
 from sqlalchemy.orm import relationship
 from fastapi_users.db import SQLAlchemyBaseUserTable
 
 from app.database import Base
 
+# Offers at or above this score are what users actually browse; partial
+# indexes below are built for this predicate.
+HIGH_MATCH_SCORE = 0.7
+
 user_skill_association = Table(
     'user_skill_association', Base.metadata,
     Column('user_skill_id', Integer, ForeignKey('user_skills.id')),
     Column('skill_id', Integer, ForeignKey('skills.id'))
 )
 
+job_offer_skill_association = Table(
+    'job_offer_skill_association', Base.metadata,
+    Column('job_offer_id', Integer, ForeignKey('job_offers.id', ondelete='CASCADE'), primary_key=True),
+    Column('skill_id', Integer, ForeignKey('skills.id', ondelete='CASCADE'), primary_key=True),
+    # "offers matching <skill>" and per-skill counts are range scans on this index
+    Index('ix_job_offer_skill_association_skill_id_job_offer_id', 'skill_id', 'job_offer_id'),
+)
+
 class JobOffer(Base):
     """Model representing a job offer."""
 
@@ -35,12 +47,67 @@ class JobOffer(Base):
     description = Column(Text, nullable=True)
     apply_link = Column(String(1020), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # Also set explicitly by the ingestion upsert, which bypasses onupdate; feed ETags hash it
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # sha256 of normalized title, company, location and apply_link; see app.helpers.bulk_insert
+    fingerprint = Column(String(64), nullable=True)
+    skills = relationship(
+        'Skill', secondary=job_offer_skill_association, passive_deletes=True)
+
+    __table_args__ = (
+        # One row per vacancy per user; ingestion upserts on this key
+        Index('uq_job_offers_user_id_fingerprint', user_id, fingerprint, unique=True),
+        # Per-user feed: filter by owner and page by (created_at, id) in one range scan
+        Index('ix_job_offers_user_id_created_at_id', user_id, created_at.desc(), id.desc()),
+        Index('ix_job_offers_user_id_score', user_id, match_score.desc(), created_at.desc(), id.desc()),
+        Index(
+            'ix_job_offers_high_match',
+            user_id, created_at.desc(), id.desc(),
+            postgresql_where=match_score >= HIGH_MATCH_SCORE,
+            sqlite_where=match_score >= HIGH_MATCH_SCORE,
+        ),
+    )
 
     def __repr__(self):
         """Return string representation of JobOffer."""
         return f"<JobOffer(title={self.title}, company={self.company})>"
 
 
+# Full-text search: a generated tsvector column with a GIN index on Postgres
+# (title weighs most, then description, then reason) and an FTS5 table on
+# SQLite. The search_vector column is not mapped so feed queries never load it.
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(reason, '')), 'C')"
+)
+
+event.listen(
+    JobOffer.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE job_offers ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    JobOffer.__table__,
+    "after_create",
+    DDL("CREATE INDEX ix_job_offers_search_vector ON job_offers USING gin (search_vector)").execute_if(dialect="postgresql"),
+)
+event.listen(
+    JobOffer.__table__,
+    "after_create",
+    DDL("CREATE VIRTUAL TABLE job_offers_fts USING fts5(title, description, reason)").execute_if(dialect="sqlite"),
+)
+event.listen(
+    JobOffer.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS job_offers_fts").execute_if(dialect="sqlite"),
+)
+
+
 class Skill(Base):
     """Model representing a skill."""
 
@@ -54,6 +121,15 @@ class Skill(Base):
         return f"<Skill(name={self.name})>"
 
 
+class CatalogVersion(Base):
+    """Model holding a version counter per cached reference catalog."""
+
+    __tablename__ = 'catalog_versions'
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
 class UserSkill(Base):
     """Model representing the relationship between users and skills."""
 
@@ -64,15 +140,16 @@ class UserSkill(Base):
 
     user = relationship("User", back_populates="user_skills")
     skills = relationship(
-        'Skill', secondary=user_skill_association, back_populates='user_skills', lazy="selectin")
+        'Skill', secondary=user_skill_association, back_populates='user_skills', lazy="raise")
 
     def get_skill_ids(self):
         """Return list of skill IDs associated with this user skill."""
         return [skill.id for skill in self.skills]
 
 
+# Both sides refuse implicit loads; handlers choose a loader strategy explicitly
 Skill.user_skills = relationship(
-    'UserSkill', secondary=user_skill_association, back_populates='skills', lazy="selectin")
+    'UserSkill', secondary=user_skill_association, back_populates='skills', lazy="raise")
 
 
 class User(SQLAlchemyBaseUserTable, Base):
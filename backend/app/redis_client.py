@@ -0,0 +1,17 @@
+"""
+Shared async Redis client for the API.
+
+Used for state every worker and instance must agree on (read-your-writes
+markers) and for change notifications to the background services. Timeouts
+are short: callers treat Redis as best-effort and fall back when it is down.
+"""
+import os
+
+import redis.asyncio
+
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+
+redis_client = redis.asyncio.Redis(
+    host=REDIS_HOST, port=REDIS_PORT, db=0, socket_timeout=1, socket_connect_timeout=1
+)
@@ -1,50 +1,184 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, Query
+import json
+from fastapi import APIRouter, Depends, HTTPException, Request, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
-from typing import List
+from sqlalchemy import func, literal
+from typing import AsyncGenerator, List, Literal
+from datetime import datetime
 from app.schemas import schemas
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 from app import models
-from app.database import get_db
+from app.database import get_db, mark_user_write, read_sessionmaker_for
 from app.auth.auth import fastapi_users 
 from app.schemas.schemas import JobOfferBase, JobOfferPage
+from app.helpers.pagination import paginate_keyset
+from app.helpers import search
+from app.helpers.skills_cache import get_skills_catalog
+from app.helpers.serialization import job_offer_fields, job_offer_page_response
+from app.helpers.events import publish_user_skills_updated
+from app.helpers.filters import LIKE_ESCAPE, contains_pattern, naive_utc
+from app.helpers.conditional import FEED_CACHE_CONTROL, if_none_match, not_modified, page_etag
 
 from app.helpers.service_token_verifire import verify_service_token
 
 get_current_user = fastapi_users.current_user()
 router = APIRouter()
 
+
+async def get_read_db(
+    current_user: models.User = Depends(get_current_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only handlers: the replica, unless the user just wrote."""
+    sessionmaker = await read_sessionmaker_for(current_user.id)
+    async with sessionmaker() as session:
+        yield session
+
+
 # JobOffer Routes
+JOB_OFFER_SORT_KEYS = {
+    "recent": (models.JobOffer.created_at, models.JobOffer.id),
+    "score": (models.JobOffer.match_score, models.JobOffer.created_at, models.JobOffer.id),
+}
+# Columns hashed into feed ETags; merges rewrite offers in place without adding rows
+JOB_OFFER_ETAG_KEYS = (models.JobOffer.created_at, models.JobOffer.match_score, models.JobOffer.updated_at)
+
+
 @router.get("/job-offers", response_model=JobOfferPage)
 async def get_job_offers(
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     limit: int = Query(20, ge=1),
-    offset: int = Query(0, ge=0),
+    offset: int | None = Query(None, ge=0),
+    cursor: str | None = Query(None),
+    min_score: float | None = Query(None, ge=0),
+    company: str | None = Query(None, min_length=1),
+    location: str | None = Query(None, min_length=1),
+    since: datetime | None = Query(None),
+    sort: Literal["recent", "score"] = Query("recent"),
+    view: Literal["summary", "full"] = Query("full"),
+    fields: str | None = Query(None, description="Comma-separated fields to return; overrides view"),
     current_user: models.User = Depends(get_current_user),
 ):
-    total = (await db.execute(
-        select(func.count()).select_from(models.JobOffer)
-    )).scalar()
+    """List the current user's job offers, newest or best match first.
+
+    Without ``offset`` the endpoint pages by cursor over the sort key and
+    ``next``/``previous`` carry opaque cursors; passing ``offset`` keeps
+    the legacy OFFSET/LIMIT behaviour. All filters run in SQL.
+
+    ``view=summary`` (or an explicit ``fields=`` list) selects only those
+    columns; ``GET /job-offers/{id}`` returns the full offer.
+
+    Pages carry a weak ETag; a matching ``If-None-Match`` gets ``304``.
+    """
+    since = naive_utc(since)
+    filters = [models.JobOffer.user_id == current_user.id]
+    if min_score is not None:
+        filters.append(models.JobOffer.match_score >= min_score)
+        if min_score >= models.HIGH_MATCH_SCORE:
+            # Inline the threshold so the planner can match the partial indexes
+            filters.append(models.JobOffer.match_score >= literal(models.HIGH_MATCH_SCORE, literal_execute=True))
+    if company:
+        filters.append(models.JobOffer.company.ilike(contains_pattern(company), escape=LIKE_ESCAPE))
+    if location:
+        filters.append(models.JobOffer.location.ilike(contains_pattern(location), escape=LIKE_ESCAPE))
+    if since:
+        filters.append(models.JobOffer.created_at >= since)
+
+    # Counted in the page's session rather than cached: the total is part of the ETag
+    total = await _count(db, select(func.count()).select_from(models.JobOffer).where(*filters))
+    keys = JOB_OFFER_SORT_KEYS[sort]
+    output_fields = job_offer_fields(view, fields)
+    # Sort keys are loaded too, since cursors and ETags are built from them
+    columns = {getattr(models.JobOffer, f) for f in output_fields}.union(keys, JOB_OFFER_ETAG_KEYS)
+    stmt = select(models.JobOffer).where(*filters).options(load_only(*columns, raiseload=True))
+
+    if offset is None:
+        offers, next_cursor, prev_cursor = await paginate_keyset(db, stmt, keys, cursor, limit)
+        next_url = str(request.url.include_query_params(cursor=next_cursor)) if next_cursor else None
+        prev_url = str(request.url.include_query_params(cursor=prev_cursor)) if prev_cursor else None
+    else:
+        offers = (await db.execute(
+            stmt
+            .order_by(*(key.desc() for key in keys))
+            .offset(offset)
+            .limit(limit)
+        )).scalars().all()
+        next_url = str(request.url.include_query_params(offset=offset + limit)) \
+            if offset + limit < total else None
+        prev_url = str(request.url.include_query_params(offset=max(offset - limit, 0))) \
+            if offset > 0 else None
+
+    etag = page_etag(request, current_user.id, total, offers, JOB_OFFER_ETAG_KEYS)
+    if if_none_match(request, etag):
+        return not_modified(etag)
+    return job_offer_page_response(
+        total, next_url, prev_url, offers, output_fields,
+        headers={"ETag": etag, "Cache-Control": FEED_CACHE_CONTROL},
+    )
 
-    offers = (await db.execute(
-        select(models.JobOffer)
-        .order_by(models.JobOffer.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-    )).scalars().all()
 
-    base_url = str(request.base_url).rstrip("/")
-    next_url = f"{base_url}/job-offers?limit={limit}&offset={offset + limit}" \
-        if total is not None and offset + limit < total else None
-    prev_url = f"{base_url}/job-offers?limit={limit}&offset={max(offset - limit, 0)}" \
-        if offset > 0 else None
+async def _count(db: AsyncSession, stmt) -> int:
+    return (await db.execute(stmt)).scalar() or 0
+
+
+@router.get("/job-offers/search", response_model=List[schemas.JobOfferSearchResult])
+async def search_job_offers(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Full-text search over the current user's offers, best match first."""
+    matches = await search.search_job_offers(db, current_user.id, q, limit)
+    return [
+        schemas.JobOfferSearchResult(
+            **JobOfferBase.model_validate(offer).model_dump(), rank=rank, highlight=highlight
+        )
+        for offer, rank, highlight in matches
+    ]
+
+
+@router.get("/job-offers/skill-stats", response_model=List[schemas.SkillOfferCount])
+async def get_job_offer_skill_stats(
+    since: datetime | None = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Count the current user's offers per matched skill, most common first."""
+    assoc = models.job_offer_skill_association
+    offer_count = func.count(assoc.c.job_offer_id).label("offer_count")
+    stmt = (
+        select(models.Skill.id, models.Skill.name, offer_count)
+        .select_from(assoc)
+        .join(models.JobOffer, models.JobOffer.id == assoc.c.job_offer_id)
+        .join(models.Skill, models.Skill.id == assoc.c.skill_id)
+        .where(models.JobOffer.user_id == current_user.id)
+        .group_by(models.Skill.id, models.Skill.name)
+        .order_by(offer_count.desc(), models.Skill.name)
+        .limit(limit)
+    )
+    if since:
+        stmt = stmt.where(models.JobOffer.created_at >= naive_utc(since))
+    rows = (await db.execute(stmt)).all()
+    return [schemas.SkillOfferCount(skill_id=r.id, name=r.name, offer_count=r.offer_count) for r in rows]
 
-    # validate/serialize ORM objects → Pydantic
-    results = [JobOfferBase.model_validate(o) for o in offers]
 
-    return JobOfferPage(count=total or 0, next=next_url, previous=prev_url, results=results)
+@router.get("/job-offers/{job_id}", response_model=schemas.JobOfferRead)
+async def get_job_offer(
+    job_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Return one of the current user's offers with its full text."""
+    result = await db.execute(
+        select(models.JobOffer)
+        .where(models.JobOffer.id == job_id, models.JobOffer.user_id == current_user.id)
+    )
+    job_offer = result.scalars().first()
+    if not job_offer:
+        raise HTTPException(status_code=404, detail="Job offer not found")
+    return job_offer
 
 
 @router.delete("/job-offers/{job_id}", response_model=schemas.JobOfferRead)
@@ -53,29 +187,78 @@ async def delete_job_offer(
     db: AsyncSession = Depends(get_db), 
     current_user: models.User = Depends(get_current_user)
     ):
-    result = await db.execute(select(models.JobOffer).where(models.JobOffer.id == job_id))
+    result = await db.execute(
+        select(models.JobOffer)
+        .where(models.JobOffer.id == job_id, models.JobOffer.user_id == current_user.id)
+    )
     job_offer = result.scalars().first()
     if not job_offer:
         raise HTTPException(status_code=404, detail="Job offer not found")
 
     await db.delete(job_offer)
+    await search.remove_from_search_index(db, [job_offer.id])
     await db.commit()
+    await mark_user_write(current_user.id)
     return job_offer
 
 # Skill Routes
+SKILLS_CACHE_CONTROL = "private, no-cache"
+
+
+def _catalog_response(request: Request, catalog, body: bytes) -> Response:
+    headers = {"ETag": catalog.etag, "Cache-Control": SKILLS_CACHE_CONTROL}
+    if if_none_match(request, catalog.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/skills", response_model=List[schemas.Skill])
-async def get_skills(db: AsyncSession = Depends(get_db), current_user: models.User = Depends(get_current_user)):
-    result = await db.execute(select(models.Skill))
-    return result.scalars().all()
+async def get_skills(request: Request, db: AsyncSession = Depends(get_read_db), current_user: models.User = Depends(get_current_user)):
+    catalog = await get_skills_catalog(db)
+    return _catalog_response(request, catalog, catalog.body)
 
 
 @router.get("/skills/{skill_id}", response_model=schemas.Skill)
-async def get_skill(skill_id: int, db: AsyncSession = Depends(get_db), current_user: models.User = Depends(get_current_user)):
-    result = await db.execute(select(models.Skill).where(models.Skill.id == skill_id))
-    skill = result.scalars().first()
+async def get_skill(skill_id: int, request: Request, db: AsyncSession = Depends(get_read_db), current_user: models.User = Depends(get_current_user)):
+    catalog = await get_skills_catalog(db)
+    skill = catalog.by_id.get(skill_id)
     if not skill:
         raise HTTPException(status_code=404, detail="Skill not found")
-    return skill
+    return _catalog_response(request, catalog, json.dumps(skill, ensure_ascii=False).encode("utf-8"))
+
+
+@router.get("/skills/{skill_id}/job-offers", response_model=JobOfferPage)
+async def get_job_offers_by_skill(
+    skill_id: int,
+    request: Request,
+    limit: int = Query(20, ge=1),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """List the current user's offers that matched ``skill_id``, newest first."""
+    assoc = models.job_offer_skill_association
+    filters = [assoc.c.skill_id == skill_id, models.JobOffer.user_id == current_user.id]
+    total = await _count(db, select(func.count()).select_from(assoc).join(
+        models.JobOffer, models.JobOffer.id == assoc.c.job_offer_id).where(*filters))
+    keys = JOB_OFFER_SORT_KEYS["recent"]
+    offers, next_cursor, prev_cursor = await paginate_keyset(
+        db,
+        select(models.JobOffer).join(assoc, assoc.c.job_offer_id == models.JobOffer.id).where(*filters),
+        keys,
+        cursor,
+        limit,
+    )
+    etag = page_etag(request, current_user.id, total, offers, JOB_OFFER_ETAG_KEYS)
+    if if_none_match(request, etag):
+        return not_modified(etag)
+    return job_offer_page_response(
+        total,
+        str(request.url.include_query_params(cursor=next_cursor)) if next_cursor else None,
+        str(request.url.include_query_params(cursor=prev_cursor)) if prev_cursor else None,
+        offers,
+        headers={"ETag": etag, "Cache-Control": FEED_CACHE_CONTROL},
+    )
 
 
 # @router.post("/skills", response_model=schemas.Skill)
@@ -90,17 +273,17 @@ async def get_skill(skill_id: int, db: AsyncSession = Depends(get_db), current_u
 # UserSkill Routes
 @router.get("/user_skills", response_model=List[schemas.UserSkill])
 async def get_user_skills(
-    db: AsyncSession = Depends(get_db), 
+    db: AsyncSession = Depends(get_read_db), 
     current_user: models.User = Depends(get_current_user)
 ):
-    result = await db.execute(select(models.UserSkill))
+    result = await db.execute(select(models.UserSkill).options(selectinload(models.UserSkill.skills)))
     return result.scalars().all()
 
 
 @router.get("/user_skills/user/{user_id}", response_model=schemas.UserSkill)
 async def get_user_skills_by_user(
     user_id: int, 
-    db: AsyncSession = Depends(get_db), 
+    db: AsyncSession = Depends(get_read_db), 
     current_user: models.User = Depends(get_current_user)
 ):
     result = await db.execute(
@@ -136,6 +319,8 @@ async def create_user_skill(
 
     db.add(user_skill)
     await db.commit()
+    await mark_user_write(current_user.id, payload.user_id)
+    await publish_user_skills_updated(payload.user_id)
 
     result = await db.execute(
         select(models.UserSkill)
@@ -171,18 +356,22 @@ async def update_user_skill(
     user_skill.skills.extend(new_skills)
 
     await db.commit()
-    await db.refresh(user_skill)
+    await mark_user_write(current_user.id, user_skill.user_id)
+    await publish_user_skills_updated(user_skill.user_id)
 
     return user_skill
 
 @router.get("/user_skill_stats", response_model=List[schemas.UserSkillStat])
-async def get_user_skill_stats(db: AsyncSession = Depends(get_db), current_user: models.User = Depends(get_current_user)):
-    result = await db.execute(select(models.UserSkill))
-    stats = result.scalars().all()
+async def get_user_skill_stats(db: AsyncSession = Depends(get_read_db), current_user: models.User = Depends(get_current_user)):
+    association = models.user_skill_association
+    result = await db.execute(
+        select(models.UserSkill.user_id, func.count(association.c.skill_id))
+        .outerjoin(association, association.c.user_skill_id == models.UserSkill.id)
+        .group_by(models.UserSkill.id, models.UserSkill.user_id)
+        .order_by(models.UserSkill.id)
+    )
     return [
-        schemas.UserSkillStat(
-            username=f"User {stat.user_id}", num_skills=len(stat.skills)
-        )
-        for stat in stats
+        schemas.UserSkillStat(username=f"User {user_id}", num_skills=num_skills)
+        for user_id, num_skills in result.all()
     ]
 
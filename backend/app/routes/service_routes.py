@@ -6,8 +6,11 @@ from typing import List
 from app.schemas import schemas
 from sqlalchemy.orm import selectinload
 from app import models
-from app.database import get_db
+from app.database import get_db, mark_user_write
 from app.helpers.service_token_verifire import verify_service_token
+from app.helpers.bulk_insert import ingest_job_offers
+from app.helpers.search import index_job_offers
+from app.helpers.job_offer_skills import link_job_offer_skills
 
 router = APIRouter()
 
@@ -28,6 +31,23 @@ async def get_all_google_credentials(
 
     return creds_dict
 
+@router.get("/user_skills/batch", response_model=List[schemas.UserSkill])
+async def get_user_skills_batch(
+    user_ids: List[int] = Query(..., min_length=1, max_length=500),
+    db: AsyncSession = Depends(get_db),
+):
+    """Return the tech stacks of several users in one round trip.
+
+    Users without a stack are left out of the response.
+    """
+    result = await db.execute(
+        select(models.UserSkill)
+        .options(selectinload(models.UserSkill.skills))
+        .where(models.UserSkill.user_id.in_(set(user_ids)))
+        .order_by(models.UserSkill.user_id)
+    )
+    return result.scalars().all()
+
 @router.get("/user_skills/user/{user_id}", response_model=schemas.UserSkill)
 async def get_user_skills_by_user(
     user_id: int,
@@ -43,16 +63,25 @@ async def get_user_skills_by_user(
         raise HTTPException(status_code=404, detail="UserSkill not found")
     return user_skill
 
-@router.post("/job_offers/bulk_create", response_model=List[schemas.JobOfferRead])
+@router.post("/job_offers/bulk_create", response_model=schemas.JobOfferBulkCreateResult, status_code=201)
 async def create_job_offers_bulk(
     payload: schemas.JobOfferBulkCreate,
     db: AsyncSession = Depends(get_db),
 ):
-    offers = [models.JobOffer(**offer.dict(exclude_unset=True)) for offer in payload.job_offers]
-    db.add_all(offers)
-    await db.commit()
+    """Create job offers, merging duplicates of vacancies the user already has.
 
-    for offer in offers:
-        await db.refresh(offer)
+    Safe to retry: re-sending the same batch merges every offer and inserts none.
+    """
+    rows = [offer.model_dump(exclude_unset=True) for offer in payload.job_offers]
+    offers, inserted, merged = await ingest_job_offers(db, rows)
+    await index_job_offers(db, offers)
+    await link_job_offer_skills(db, offers)
+    await db.commit()
+    # Let the owners see their new offers before the replica catches up
+    await mark_user_write(*{o.user_id for o in offers})
 
-    return offers
\ No newline at end of file
+    return schemas.JobOfferBulkCreateResult(
+        inserted=inserted,
+        merged=merged,
+        job_offers=[schemas.JobOfferRead.model_validate(o) for o in offers],
+    )
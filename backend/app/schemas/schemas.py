@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
 from typing import List, Optional
 from datetime import datetime
 from fastapi_users.schemas import BaseUser, BaseUserCreate, BaseUserUpdate
@@ -28,9 +28,24 @@ class JobOfferPage(BaseModel):
     results: list[JobOfferBase]
 
 
+class JobOfferSearchResult(JobOfferBase):
+    rank: float
+    highlight: str | None = None
+
+
 class JobOfferCreate(JobOfferBase):
+    id: Optional[int] = None
     email: Optional[EmailStr] = Field(
         default=None, description="Email associated with the job offer")
+    created_at: Optional[datetime] = None
+
+    @field_validator("technologies_matched", mode="before")
+    @classmethod
+    def join_technologies(cls, value):
+        """Accept the analyzer's JSON list as well as comma-separated text."""
+        if isinstance(value, list):
+            return ", ".join(str(item) for item in value)
+        return value
 
 
 class JobOfferBulkCreate(BaseModel):
@@ -45,6 +60,12 @@ class JobOfferRead(JobOfferBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class JobOfferBulkCreateResult(BaseModel):
+    inserted: int
+    merged: int
+    job_offers: List[JobOfferRead]
+
+
 class SkillBase(BaseModel):
     name: str = Field(..., max_length=100, description="Name of the skill")
 
@@ -59,6 +80,12 @@ class Skill(SkillBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class SkillOfferCount(BaseModel):
+    skill_id: int
+    name: str
+    offer_count: int
+
+
 class UserSkillBase(BaseModel):
     user_id: int
 
@@ -0,0 +1,79 @@
+"""
+Compare job offer bulk insert throughput: per-row ORM refresh vs set-based.
+
+    python -m benchmarks.bulk_insert_benchmark [--url URL] [--sizes 10 1000 50000]
+
+The set-based side is the real ingestion path (fingerprint, existence check,
+chunked upsert). Statement counts are reported next to throughput so a
+regression to row-at-a-time INSERTs is visible on any backend.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import event
+
+from app import models
+from app.helpers.bulk_insert import BULK_CREATE_CHUNK_SIZE, ingest_job_offers
+from benchmarks.common import DEFAULT_URL, create_schema, synthetic_offer
+
+
+async def legacy_insert(db, rows):
+    """The previous path: add_all, commit, then one refresh per offer."""
+    offers = [models.JobOffer(**row) for row in rows]
+    db.add_all(offers)
+    await db.commit()
+    for offer in offers:
+        await db.refresh(offer)
+    return offers
+
+
+async def set_based_insert(db, rows, chunk_size):
+    offers, _, _ = await ingest_job_offers(db, rows, chunk_size)
+    await db.commit()
+    return offers
+
+
+async def main(url: str, sizes: list[int], chunk_size: int) -> None:
+    rng = random.Random(42)
+    engine, Session = await create_schema(url)
+    statements = 0
+
+    def count_statement(*args):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        print(
+            f"{'offers':>8} {'legacy rows/s':>15} {'statements':>11} "
+            f"{'set-based rows/s':>18} {'statements':>11} {'speedup':>8}"
+        )
+        for size in sizes:
+            rows = [synthetic_offer(rng) for _ in range(size)]
+            timings, counts = [], []
+            for insert in (legacy_insert, lambda db, r: set_based_insert(db, r, chunk_size)):
+                async with Session() as session:
+                    statements = 0
+                    start = time.perf_counter()
+                    created = await insert(session, [dict(row) for row in rows])
+                    timings.append(time.perf_counter() - start)
+                    counts.append(statements)
+                    assert len(created) == size
+            legacy, set_based = (size / t for t in timings)
+            print(
+                f"{size:>8} {legacy:>15,.0f} {counts[0]:>11,} "
+                f"{set_based:>18,.0f} {counts[1]:>11,} {set_based / legacy:>7.1f}x"
+            )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 50_000])
+    parser.add_argument("--chunk-size", type=int, default=BULK_CREATE_CHUNK_SIZE)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.sizes, args.chunk_size))
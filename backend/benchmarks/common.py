@@ -0,0 +1,68 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run from the ``backend`` directory, e.g.
+``python -m benchmarks.search_benchmark``. They default to a throwaway local
+SQLite file; pass ``--url`` to point them at a Postgres database instead.
+"""
+import random
+import statistics
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.database import Base
+
+DEFAULT_URL = "sqlite+aiosqlite:///benchmark.sqlite3"
+
+WORDS = (
+    "python django fastapi flask postgresql redis docker kubernetes aws gcp react typescript "
+    "node graphql rest api backend frontend platform engineer developer senior junior remote "
+    "hybrid team product delivery scale reliability performance cloud data pipeline linux"
+).split()
+COMPANIES = ["VoltStack", "Asteria Tech", "Northwind", "Globex", "Initech", "Umbrella", "Hooli"]
+LOCATIONS = ["Remote", "Leeds, UK", "Zurich, Switzerland", "Stockholm, Sweden", "Warsaw, Poland"]
+
+
+async def create_schema(url: str) -> tuple[AsyncEngine, async_sessionmaker]:
+    """Create a fresh schema at ``url`` and return its engine and sessionmaker."""
+    engine = create_async_engine(url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+    except BaseException:
+        await engine.dispose()
+        raise
+    return engine, async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def synthetic_offer(rng: random.Random, user_id: int = 1) -> dict:
+    """Return kwargs for a plausible-looking ``JobOffer``."""
+    return {
+        "user_id": user_id,
+        "email": f"jobs+{rng.randrange(10**6)}@example.com",
+        "match_score": round(rng.random(), 2),
+        "reason": " ".join(rng.choices(WORDS, k=12)),
+        "technologies_matched": ", ".join(rng.sample(WORDS, 5)),
+        "title": " ".join(rng.sample(WORDS, 3)).title(),
+        "company": rng.choice(COMPANIES),
+        "location": rng.choice(LOCATIONS),
+        "description": " ".join(rng.choices(WORDS, k=120)),
+        "apply_link": f"https://example.com/jobs/{rng.randrange(10**9)}",
+        "created_at": datetime(2025, 1, 1) + timedelta(seconds=rng.randrange(10**7)),
+    }
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def report(name: str, samples_ms: list[float]) -> None:
+    print(
+        f"{name:<32} n={len(samples_ms):<6} "
+        f"p50={percentile(samples_ms, 50):8.2f}ms  p99={percentile(samples_ms, 99):8.2f}ms  "
+        f"mean={statistics.fmean(samples_ms):8.2f}ms"
+    )
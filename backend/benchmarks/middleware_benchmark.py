@@ -0,0 +1,83 @@
+"""
+Report requests/sec on /health/async and /job-offers through the middleware stack.
+
+    python -m benchmarks.middleware_benchmark [--url URL] [--requests 2000]
+
+The app's middlewares are plain ASGI callables. For comparison the same app is
+also wrapped in three pass-through ``BaseHTTPMiddleware`` layers, which adds
+the per-request task and stream overhead the previous implementation paid.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import time
+
+os.environ.setdefault("ALLOWED_HOSTS", "testserver")
+
+import httpx
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app import models
+from app.main import app
+from app.routes.routes import get_current_user, get_read_db
+from benchmarks.common import DEFAULT_URL, create_schema, synthetic_offer
+
+OFFERS = 500
+
+
+async def passthrough(request, call_next):
+    return await call_next(request)
+
+
+async def run(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path)
+        response.raise_for_status()
+    return requests / (time.perf_counter() - start)
+
+
+async def main(url: str, requests: int) -> None:
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(42)
+    engine, Session = await create_schema(url)
+    try:
+        async with Session() as session:
+            async with session.begin():
+                session.add(models.User(id=1, email="bench@example.com", hashed_password="x"))
+                session.add_all(models.JobOffer(**synthetic_offer(rng)) for _ in range(OFFERS))
+
+        async def override_db():
+            async with Session() as session:
+                yield session
+
+        user = models.User(id=1, email="bench@example.com")
+        app.dependency_overrides[get_read_db] = override_db
+        app.dependency_overrides[get_current_user] = lambda: user
+
+        legacy = app
+        for _ in range(3):
+            legacy = BaseHTTPMiddleware(legacy, dispatch=passthrough)
+
+        for path in ("/health/async", "/job-offers?limit=20"):
+            results = {}
+            for name, target in (("BaseHTTPMiddleware x3", legacy), ("pure ASGI", app)):
+                transport = httpx.ASGITransport(app=target)
+                async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                    await run(client, path, 50)  # warm up
+                    results[name] = await run(client, path, requests)
+            for name, rate in results.items():
+                print(f"{path:<24} {name:<24} {rate:10.1f} req/s")
+            print(f"{path:<24} {'gain':<24} {results['pure ASGI'] / results['BaseHTTPMiddleware x3']:10.2f}x")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.requests))
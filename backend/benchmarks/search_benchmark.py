@@ -0,0 +1,56 @@
+"""
+Load ~100k synthetic job offers and report full-text search latency.
+
+    python -m benchmarks.search_benchmark [--url URL] [--offers 100000] [--queries 500]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from app import models
+from app.helpers.search import index_job_offers, search_job_offers
+from benchmarks.common import DEFAULT_URL, WORDS, create_schema, report, synthetic_offer
+
+BATCH_SIZE = 5_000
+
+
+async def main(url: str, offers: int, queries: int) -> None:
+    rng = random.Random(42)
+    engine, Session = await create_schema(url)
+    try:
+        start = time.perf_counter()
+        async with Session() as session:
+            async with session.begin():
+                for batch_start in range(0, offers, BATCH_SIZE):
+                    batch = [
+                        models.JobOffer(**synthetic_offer(rng))
+                        for _ in range(min(BATCH_SIZE, offers - batch_start))
+                    ]
+                    session.add_all(batch)
+                    await session.flush()
+                    await index_job_offers(session, batch)
+        print(f"Loaded {offers} offers in {time.perf_counter() - start:.1f}s")
+
+        single, double = [], []
+        async with Session() as session:
+            for _ in range(queries):
+                for samples, terms in ((single, 1), (double, 2)):
+                    q = " ".join(rng.sample(WORDS, terms))
+                    start = time.perf_counter()
+                    await search_job_offers(session, 1, q, 20)
+                    samples.append((time.perf_counter() - start) * 1000)
+
+        report("search, one term", single)
+        report("search, two terms", double)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--offers", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.offers, args.queries))
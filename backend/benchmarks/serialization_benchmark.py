@@ -0,0 +1,59 @@
+"""
+Time rendering a 100-offer page through Pydantic versus the orjson fast path.
+
+    python -m benchmarks.serialization_benchmark [--pages 500]
+
+"before" mirrors the old handler: ``model_validate`` per offer, then FastAPI's
+``response_model`` validation and serialization, then ``JSONResponse``.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app import models
+from app.helpers.serialization import job_offer_page_response
+from app.schemas.schemas import JobOfferBase, JobOfferPage
+from benchmarks.common import report, synthetic_offer
+
+PAGE_SIZE = 100
+
+
+async def pydantic_page(field, offers) -> bytes:
+    page = JobOfferPage(
+        count=len(offers), next=None, previous=None,
+        results=[JobOfferBase.model_validate(o) for o in offers],
+    )
+    content = await serialize_response(field=field, response_content=page)
+    return JSONResponse(content).body
+
+
+async def main(pages: int) -> None:
+    rng = random.Random(42)
+    offers = [models.JobOffer(id=i, **synthetic_offer(rng)) for i in range(PAGE_SIZE)]
+    field = create_model_field(name="Response", type_=JobOfferPage, mode="serialization")
+
+    before, after = [], []
+    for _ in range(pages):
+        start = time.perf_counter()
+        slow = await pydantic_page(field, offers)
+        before.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        fast = job_offer_page_response(len(offers), None, None, offers).body
+        after.append((time.perf_counter() - start) * 1000)
+
+    print(f"page body: {len(slow)} bytes (pydantic) / {len(fast)} bytes (orjson)")
+    report(f"pydantic, {PAGE_SIZE} offers", before)
+    report(f"orjson fast path, {PAGE_SIZE} offers", after)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages))
@@ -0,0 +1,78 @@
+"""
+Compare /service request throughput with and without the service-token cache.
+
+    python -m benchmarks.service_auth_benchmark [--url URL] [--requests 2000]
+
+Requests go through the full middleware stack in process (no network), so the
+difference between the two runs is the cost of verifying the JWT every time.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+os.environ.setdefault("ALLOWED_HOSTS", "testserver")
+
+import httpx
+from cachetools import LRUCache
+
+from app import models
+from app.database import get_db
+from app.helpers import service_token_verifire
+from app.main import app
+from benchmarks.common import DEFAULT_URL, create_schema
+from services.service_auth.utils import create_jwt_token
+
+
+async def run(client: httpx.AsyncClient, path: str, headers: dict, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path, headers=headers)
+        response.raise_for_status()
+    return requests / (time.perf_counter() - start)
+
+
+async def main(url: str, requests: int) -> None:
+    logging.disable(logging.CRITICAL)
+    engine, Session = await create_schema(url)
+    try:
+        async with Session() as session:
+            async with session.begin():
+                session.add(models.User(id=1, email="bench@example.com", hashed_password="x"))
+                session.add(models.Skill(id=1, name="Python"))
+                user_skill = models.UserSkill(user_id=1)
+                session.add(user_skill)
+                await session.flush()
+                await session.execute(
+                    models.user_skill_association.insert().values(user_skill_id=user_skill.id, skill_id=1)
+                )
+
+        async def override_db():
+            async with Session() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_db
+        headers = {"Authorization": f"Bearer {create_jwt_token('digest_generator')}"}
+        path = "/service/user_skills/user/1"
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            await run(client, path, headers, 50)  # warm up
+
+            service_token_verifire._verified_tokens = None
+            uncached = await run(client, path, headers, requests)
+            service_token_verifire._verified_tokens = LRUCache(maxsize=service_token_verifire.SERVICE_TOKEN_CACHE_SIZE)
+            cached = await run(client, path, headers, requests)
+
+        print(f"{'jwt.decode on every request':<32} {uncached:10.1f} req/s")
+        print(f"{'verified-token cache':<32} {cached:10.1f} req/s  ({cached / uncached:.2f}x)")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.requests))
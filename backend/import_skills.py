@@ -3,6 +3,7 @@ import json
 from app.models import Skill
 # Import the sessionmaker from database.py
 from app.database import AsyncSessionLocal
+from app.helpers.skills_cache import bump_skills_version
 
 
 async def load_skills(json_path: str):
@@ -15,6 +16,7 @@ async def load_skills(json_path: str):
             for skill in skills:
                 db_skill = Skill(id=skill["id"], name=skill["name"])
                 await session.merge(db_skill)  # insert or update if exists
+            await bump_skills_version(session)  # invalidate API skills caches
         print(f"✅ Imported {len(skills)} skills.")
 
 
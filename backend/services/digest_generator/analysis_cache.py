@@ -0,0 +1,111 @@
+"""
+Content-addressed cache of per-job analysis results.
+
+Recruiter blasts and re-sent digests repeat the same text, so each job's
+analysis is stored under a hash of its normalized ``full_text``, the sorted
+tech stack and the prompt version. Entries live in Redis, shared by every
+generator process, expire after ``ANALYSIS_CACHE_TTL_SECONDS`` and are evicted
+least-recently-used once there are more than ``ANALYSIS_CACHE_MAX_ENTRIES``.
+Jobs the model filtered out are cached too, so they are not re-sent either.
+Hits and misses are exported as Prometheus counters and also summed across
+processes in the ``analysis_cache:stats`` hash.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+import unicodedata
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import metrics
+import redis
+
+ANALYSIS_CACHE_TTL_SECONDS = int(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", 50_000))
+KEY_PREFIX = "analysis_cache:"
+INDEX_KEY = KEY_PREFIX + "index"  # sorted set of keys by last use
+STATS_KEY = KEY_PREFIX + "stats"
+
+SKIPPED = {"skipped": True}
+URL = re.compile(r"https?://[^\s<>\"']+", re.IGNORECASE)
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = re.compile(r"^(utm_.*|trk.*|ref|refid|trackingid|gclid|fbclid)$", re.IGNORECASE)
+
+
+def _strip_tracking(match: re.Match) -> str:
+    parts = urlsplit(match.group(0))
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not TRACKING_PARAMS.match(k)]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def normalize_text(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    text = URL.sub(_strip_tracking, text)
+    return " ".join(text.split())
+
+
+def cache_key(full_text: str, tech_stack: list[str], prompt_version: str) -> str:
+    stack = sorted({skill.casefold() for skill in tech_stack})
+    material = json.dumps([prompt_version, stack, normalize_text(full_text)], ensure_ascii=False)
+    return KEY_PREFIX + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    def __init__(self, client: redis.Redis, ttl_seconds: int = ANALYSIS_CACHE_TTL_SECONDS,
+                 max_entries: int = ANALYSIS_CACHE_MAX_ENTRIES):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys: list[str]) -> dict[str, dict]:
+        """Return the cached results among ``keys``; absent keys are misses."""
+        if not keys:
+            return {}
+        values = self.client.mget(keys)
+        found = {key: json.loads(value) for key, value in zip(keys, values) if value is not None}
+
+        now = time.time()
+        pipe = self.client.pipeline(transaction=False)
+        if found:
+            pipe.zadd(INDEX_KEY, {key: now for key in found})
+        pipe.hincrby(STATS_KEY, "hits", len(found))
+        pipe.hincrby(STATS_KEY, "misses", len(keys) - len(found))
+        pipe.execute()
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        metrics.ANALYSIS_CACHE_HITS.inc(len(found))
+        metrics.ANALYSIS_CACHE_MISSES.inc(len(keys) - len(found))
+        return found
+
+    def set_many(self, results: dict[str, dict]) -> None:
+        """Store ``results`` and evict the least recently used entries beyond the size bound."""
+        if not results:
+            return
+        now = time.time()
+        pipe = self.client.pipeline(transaction=False)
+        for key, result in results.items():
+            pipe.set(key, json.dumps(result), ex=self.ttl_seconds)
+        pipe.zadd(INDEX_KEY, {key: now for key in results})
+        # Index entries whose key already expired are dropped with it
+        pipe.zremrangebyscore(INDEX_KEY, "-inf", now - self.ttl_seconds)
+        pipe.zcard(INDEX_KEY)
+        size = pipe.execute()[-1]
+
+        overflow = size - self.max_entries
+        if overflow > 0:
+            evicted = [key for key, _ in self.client.zpopmin(INDEX_KEY, overflow)]
+            if evicted:
+                self.client.delete(*evicted)
+
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts of this process and, under ``total_``, of all processes."""
+        totals = {k.decode() if isinstance(k, bytes) else k: int(v) for k, v in self.client.hgetall(STATS_KEY).items()}
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_hits": totals.get("hits", 0),
+            "total_misses": totals.get("misses", 0),
+        }
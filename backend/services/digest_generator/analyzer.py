@@ -1,9 +1,15 @@
 from dotenv import load_dotenv
 from g4f.client import Client
 import json
+import os
 
 load_dotenv()
 
+# Upper bound for a single model call, enforced by the client
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", 30))
+# Part of every analysis cache key; bump whenever the prompt or output schema changes
+PROMPT_VERSION = "2"
+
 def build_prompt(jobs: dict, tech_stack: list) -> str:
     return f"""
 You are a job-search assistant.
@@ -15,6 +21,7 @@ jobs : {jobs}           ← array of job objects:
   • full_text  – full job description
   • subject    – email subject (may be empty)
   • id         – unique identifier (may be empty)
+  • ref        – reference of the job within this request
 
 User tech stack: {tech_stack}
 
@@ -43,6 +50,7 @@ Leave unknown fields as empty strings.  Do not invent data.
 {{
   "results": [
     {{
+      "ref": "<ref from input, unchanged>",
       "email": "<email from input>",
       "match_score": <integer 1-10>,
       "reason": "<brief justification of the score, touching on all criteria>",
@@ -65,14 +73,14 @@ CONSTRAINTS
 
 def analyze_job(jobs: dict, tech_stack: list) -> dict:
     prompt = build_prompt(jobs, tech_stack)
-    print(f"🔍 Analyzing job offer with g4f for:\n{prompt}\n")
+    print(f"🔍 Analyzing {len(jobs)} job offers with g4f ({len(prompt)} prompt chars)")
 
     try:
         client = Client()
         response = client.chat.completions.create(
             model="gpt-4",  # You can also try "gpt-4o" or "gpt-3.5-turbo"
             messages=[{"role": "user", "content": prompt}],
-            timeout=30
+            timeout=LLM_TIMEOUT_SECONDS
         )
         content = response.choices[0].message.content.strip()
     except Exception as e:  # pylint: disable=broad-except
@@ -86,5 +94,5 @@ def analyze_job(jobs: dict, tech_stack: list) -> dict:
     try:
         return json.loads(content)
     except Exception:  # pylint: disable=broad-except
-        print("Failed to parse GPT response:", content)
+        print(f"Failed to parse GPT response ({len(content)} chars): {content[:200]}")
         return {}
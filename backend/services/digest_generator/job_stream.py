@@ -0,0 +1,103 @@
+"""
+Consumer side of the ``jobs`` Redis Stream.
+
+The Gmail reader appends job offers with ``XADD``; digest generators read them
+through one consumer group, so each entry goes to a single generator and stays
+pending until that generator acknowledges it. Entries left pending by a
+generator that crashed or failed are reclaimed by whichever generator polls
+next, and entries that keep failing are moved to a dead-letter stream.
+
+Everything goes through the injected client, so it works the same against
+Redis and ``fakeredis``.
+"""
+import json
+import os
+
+import redis
+
+JOBS_STREAM = os.getenv("JOBS_STREAM", "jobs")
+JOBS_DEAD_LETTER_STREAM = os.getenv("JOBS_DEAD_LETTER_STREAM", "jobs:dead")
+JOBS_GROUP = os.getenv("JOBS_GROUP", "digest_generator")
+# Pending entries idle this long are assumed abandoned and handed to another consumer
+RECLAIM_IDLE_MS = int(os.getenv("JOBS_RECLAIM_IDLE_MS", 5 * 60 * 1000))
+MAX_DELIVERIES = int(os.getenv("JOBS_MAX_DELIVERIES", 5))
+DEAD_LETTER_MAXLEN = 10_000
+
+
+class JobStream:
+    def __init__(self, client: redis.Redis, consumer: str, stream: str = JOBS_STREAM, group: str = JOBS_GROUP):
+        self.client = client
+        self.consumer = consumer
+        self.stream = stream
+        self.group = group
+
+    def ensure_group(self) -> None:
+        """Create the stream and consumer group unless they already exist."""
+        try:
+            self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def read(self, count: int, block_ms: int) -> list[tuple[str, dict]]:
+        """Return up to ``count`` new entries as ``(entry_id, job)``, waiting up to ``block_ms``."""
+        response = self.client.xreadgroup(self.group, self.consumer, {self.stream: ">"}, count=count, block=block_ms)
+        return [entry for _, messages in response or [] for entry in self._decode(messages)]
+
+    def reclaim(self, count: int, exclude: set = frozenset(), min_idle_ms: int = RECLAIM_IDLE_MS) -> list[tuple[str, dict]]:
+        """Take over entries left pending for ``min_idle_ms``, by any consumer.
+
+        ``exclude`` holds ids this consumer is still holding on to. Entries
+        already delivered ``MAX_DELIVERIES`` times are dead-lettered instead of
+        being returned.
+        """
+        pending = self.client.xpending_range(
+            self.stream, self.group, min="-", max="+", count=count + len(exclude), idle=min_idle_ms
+        )
+        pending = [p for p in pending if p["message_id"] not in exclude][:count]
+        if not pending:
+            return []
+        ids = [p["message_id"] for p in pending]
+        exhausted = {p["message_id"] for p in pending if p["times_delivered"] >= MAX_DELIVERIES}
+        claimed = self.client.xclaim(self.stream, self.group, self.consumer, min_idle_ms, ids)
+
+        entries = []
+        for entry_id, job in self._decode(claimed):
+            if entry_id in exhausted:
+                self.dead_letter(entry_id, job)
+            else:
+                entries.append((entry_id, job))
+        return entries
+
+    def ack(self, entry_ids: list[str]) -> None:
+        if entry_ids:
+            self.client.xack(self.stream, self.group, *entry_ids)
+
+    def dead_letter(self, entry_id: str, job: dict) -> None:
+        """Park an entry that keeps failing and stop redelivering it."""
+        self.client.xadd(
+            JOBS_DEAD_LETTER_STREAM,
+            {"source_id": _as_str(entry_id), "data": json.dumps(job)},
+            maxlen=DEAD_LETTER_MAXLEN,
+            approximate=True,
+        )
+        self.ack([entry_id])
+        print(f"☠️ Moved job {_as_str(entry_id)} to {JOBS_DEAD_LETTER_STREAM} after {MAX_DELIVERIES} deliveries")
+
+    def _decode(self, messages) -> list[tuple[str, dict]]:
+        entries = []
+        for entry_id, fields in messages:
+            if not fields:  # deleted by trimming while pending
+                self.ack([entry_id])
+                continue
+            raw = fields.get(b"data", fields.get("data"))
+            try:
+                entries.append((entry_id, json.loads(raw)))
+            except (TypeError, ValueError):
+                print("Invalid JSON:", raw)
+                self.ack([entry_id])
+        return entries
+
+
+def _as_str(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
@@ -1,113 +1,264 @@
 import json
+import os
+import socket
+import sys
+import time
 
+import metrics
 import redis
 import requests
-from analyzer import analyze_job
+from analysis_cache import SKIPPED, AnalysisCache, cache_key
+from analyzer import PROMPT_VERSION, analyze_job
+from batcher import AdaptiveBatcher
+from job_stream import JobStream
+from prometheus_client import start_http_server
+from skill_matcher import SkillMatcher
+from worker_pool import AnalysisPool
 
-r = redis.Redis(host="localhost", port=6379, db=0)
-pubsub = r.pubsub()
-pubsub.subscribe("jobs")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from service_auth.client import ServiceClient
 
-print("Listening for job offers...")
+# Published by the API whenever a user's skills change
+USER_SKILLS_UPDATED_CHANNEL = "user_skills_updated"
 
-BUFFER_SIZE = 5
-job_buffer = []
+r = redis.Redis(host=os.getenv("REDIS_HOST", "localhost"), port=6379, db=0)
+# Each generator process is its own consumer in the shared group
+CONSUMER_NAME = os.getenv("CONSUMER_NAME", f"{socket.gethostname()}-{os.getpid()}")
+job_stream = JobStream(r, CONSUMER_NAME)
+analysis_cache = AnalysisCache(r)
 
-API_URL = "http://0.0.0.0:8000/job_offers/bulk_create"
+# Batches are cut at BATCH_MIN_SIZE when a worker is free, grow up to BATCH_MAX_SIZE
+# jobs or BATCH_MAX_TOKENS while all are busy, and never wait past BATCH_MAX_WAIT_SECONDS
+BATCH_MIN_SIZE = int(os.getenv("BATCH_MIN_SIZE", 3))
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", 20))
+BATCH_MAX_TOKENS = int(os.getenv("BATCH_MAX_TOKENS", 12_000))
+BATCH_MAX_WAIT_SECONDS = float(os.getenv("BATCH_MAX_WAIT_SECONDS", 60))
+READ_BLOCK_MS = 5000
+batcher = AdaptiveBatcher(BATCH_MIN_SIZE, BATCH_MAX_SIZE, BATCH_MAX_WAIT_SECONDS, BATCH_MAX_TOKENS)
+
+# Batches analyzed at once, and batches allowed to wait for a worker before intake pauses
+ANALYSIS_CONCURRENCY = int(os.getenv("ANALYSIS_CONCURRENCY", 4))
+ANALYSIS_MAX_QUEUED = int(os.getenv("ANALYSIS_MAX_QUEUED", 4))
+in_progress_ids = set()  # entries handed to the pool and not yet acknowledged
+
+API_URL = "http://0.0.0.0:8000/service/job_offers/bulk_create"
 SERVICE_NAME = "digest_generator"
 SERVICE_SECRET = "digest_generator_secret"
-SERVICE_TOKEN_ENDPOINT = "http://localhost:8001/auth/token"
+USER_SKILLS_BATCH_URL = "http://0.0.0.0:8000/service/user_skills/batch"
+
+# Stacks are also dropped on update notifications; the TTL bounds staleness if one is missed
+TECH_STACK_TTL_SECONDS = float(os.getenv("TECH_STACK_TTL_SECONDS", 300))
+tech_stack_cache: dict[int, tuple[float, list[str]]] = {}
+
+api = ServiceClient(SERVICE_NAME, SERVICE_SECRET)
 
-def get_service_auth_token():
+# Offers sharing fewer skills than this with the user's stack never reach the model
+PRESCORE_MIN_MATCHES = int(os.getenv("PRESCORE_MIN_MATCHES", 1))
+skill_matcher = SkillMatcher.from_catalog()
+
+def fetch_user_tech_stacks(user_ids: list[int]) -> dict[int, list[str]] | None:
     """
-    Retrieves the service auth token from environment variables or a config file.
+    Returns the tech stack of each user, fetching every uncached one in a single request.
+    None if the request failed, so callers can tell it apart from an empty stack.
     """
-    response = requests.post(SERVICE_TOKEN_ENDPOINT, json={
-        "service_name": SERVICE_NAME,
-        "service_secret": SERVICE_SECRET
-    })
-    if response.status_code == 200:
-        return response.json().get("access_token")
-    raise Exception("Failed to retrieve service auth token")
-
-def fetch_user_tech_stack(user_id: int) -> list[str]:
-    try:
-        response = requests.get(
-            f"http://0.0.0.0:8000/service/user_skills/user/{user_id}",
-            headers={"Authorization": f"Bearer {get_service_auth_token()}"},
-            timeout=10
-        )
-        response.raise_for_status()
-        data = response.json()
-        print(f"Fetched user skills for user {user_id}: {data}")
-        if isinstance(data, dict) and data:
-            skills = data.get("skills", [])
-            return [skill["name"] for skill in skills]
+    now = time.monotonic()
+    stacks = {}
+    missing = []
+    for user_id in user_ids:
+        cached = tech_stack_cache.get(user_id)
+        if cached and cached[0] > now:
+            stacks[user_id] = cached[1]
         else:
-            print("No user skills found")
-            return []
+            missing.append(user_id)
+    if not missing:
+        return stacks
 
-    except requests.RequestException as e:
+    try:
+        response = api.get(USER_SKILLS_BATCH_URL, params={"user_ids": missing})
+        response.raise_for_status()
+        fetched = {item["user_id"]: [skill["name"] for skill in item["skills"]] for item in response.json()}
+    except requests.RequestException as e:  # includes an unparsable body
         print(f"Failed to fetch user skills: {e}")
-        return []
+        return None
+
+    print(f"Fetched user skills for users {missing}: {fetched}")
+    for user_id in missing:
+        stacks[user_id] = fetched.get(user_id, [])
+        tech_stack_cache[user_id] = (now + TECH_STACK_TTL_SECONDS, stacks[user_id])
+    return stacks
+
+def fetch_user_tech_stack(user_id: int) -> list[str] | None:
+    stacks = fetch_user_tech_stacks([user_id])
+    return None if stacks is None else stacks.get(user_id, [])
 
-def send_bulk_to_api(jobs: list[dict]):
+def invalidate_tech_stacks(raw_data: str) -> None:
     try:
-        response = requests.post(
-            API_URL, json={"job_offers": jobs}, headers={"Authorization": f"Bearer {get_service_auth_token()}"}, timeout=10)
+        user_ids = json.loads(raw_data)
+    except json.JSONDecodeError:
+        print("Invalid user skills update:", raw_data)
+        return
+    for user_id in user_ids:
+        tech_stack_cache.pop(user_id, None)
+    print(f"♻️ Tech stack cache invalidated for users {user_ids}")
+
+def send_bulk_to_api(jobs: list[dict]) -> bool:
+    try:
+        response = api.post(API_URL, json={"job_offers": jobs})
         if response.status_code == 201:
-            print(f"✅ Sent {len(jobs)} jobs to API.")
-        else:
-            print(f"API error {response.status_code}: {response.text}")
+            result = response.json()
+            print(f"✅ Sent {len(jobs)} jobs to API: {result['inserted']} new, {result['merged']} merged.")
+            return True
+        print(f"API error {response.status_code}: {response.text}")
     except requests.RequestException as e:
         print(f"Failed to reach API: {e}")
+    return False
+
+
+def prescore(jobs: list[dict], tech_stack: list[str]) -> list[dict]:
+    """
+    Returns the jobs that mention at least PRESCORE_MIN_MATCHES of the user's skills.
+    Keeps every job when the stack has skills the catalog lacks.
+    """
+    if not skill_matcher.knows(tech_stack):
+        return jobs
+    plausible = [
+        job for job in jobs
+        if skill_matcher.score(f"{job.get('subject', '')}\n{job['full_text']}", tech_stack) >= PRESCORE_MIN_MATCHES
+    ]
+    metrics.PRESCORED_JOBS.labels("kept").inc(len(plausible))
+    metrics.PRESCORED_JOBS.labels("dropped").inc(len(jobs) - len(plausible))
+    if len(plausible) < len(jobs):
+        print(f"🧹 Pre-scorer dropped {len(jobs) - len(plausible)} of {len(jobs)} jobs below {PRESCORE_MIN_MATCHES} matching skills")
+    return plausible
+
+
+def analyze_with_cache(jobs: list[dict], tech_stack: list[str]) -> list[dict] | None:
+    """
+    Returns the results for the jobs that passed the model's filter, sending only
+    the jobs missing from the analysis cache to the model. None if the model call failed.
+    """
+    keys = [cache_key(job["full_text"], tech_stack, PROMPT_VERSION) for job in jobs]
+    cached = analysis_cache.get_many(list(dict.fromkeys(keys)))
+    misses = {}  # identical texts within the batch are analyzed once
+    for key, job in zip(keys, jobs):
+        if key not in cached:
+            misses.setdefault(key, job)
+    hits = sum(key in cached for key in keys)
+    print(f"🗃️ Analysis cache: {hits} of {len(jobs)} jobs cached, {len(misses)} sent to the model")
+
+    unmatched = []
+    if misses:
+        miss_keys = list(misses)
+        analysis_result = analyze_job(
+            [{**job, "ref": str(i)} for i, job in enumerate(misses.values())], tech_stack
+        )
+        if not analysis_result:
+            return None
+
+        fresh = {}
+        for result in analysis_result.get("results", []):
+            ref = str(result.pop("ref", ""))
+            if ref.isdigit() and int(ref) < len(miss_keys):
+                fresh[miss_keys[int(ref)]] = result
+            else:
+                unmatched.append(result)
+        # Jobs without a result were filtered out by the model, unless some results could not be matched
+        if not unmatched:
+            fresh = {key: fresh.get(key, SKIPPED) for key in miss_keys}
+        analysis_cache.set_many(fresh)
+        cached.update(fresh)
 
+    results = []
+    for key, job in zip(keys, jobs):
+        result = cached.get(key, SKIPPED)
+        if result != SKIPPED:
+            # A cached result may come from the same text sent to another address
+            results.append({**result, "email": job.get("email") or result.get("email")})
+    return results + unmatched
 
-def analyze_and_send(jobs: dict) -> None:
+
+def analyze_and_send(jobs: list[dict]) -> bool:
+    """
+    Returns True once the batch is fully handled and can be acknowledged.
+    """
     print(f"\n🔎 Analyzing {len(jobs)} job offers...")
-    # Pass the list of job objects directly to analyze_job
-    tech_stack = fetch_user_tech_stack(user_id=1) # Replace with actual user ID
+    user_id = 1 # Replace with actual user ID
+    tech_stack = fetch_user_tech_stack(user_id=user_id)
+    if tech_stack is None:
+        # Leave the entries pending so they are retried once the API is reachable
+        return False
     if not tech_stack:
         print("No user tech stack found, skipping analysis.")
-        return
-    analysis_result = analyze_job(jobs, tech_stack)
+        return True
+    jobs = prescore(jobs, tech_stack)
+    if not jobs:
+        return True
+    results = analyze_with_cache(jobs, tech_stack)
 
-    if not analysis_result:
+    if results is None:
         print("No valid analysis result returned")
-        return
-
-    print("Analysis result:")
-    # print(json.dumps(analysis_result, indent=2))
+        return False
 
-    job_results = analysis_result.get("results", [])
+    # Offers are scoped per user in the API, so tag each one with its owner
+    job_results = [{**job, "user_id": user_id} for job in results]
     if job_results:
-        send_bulk_to_api(job_results)
-    else:
-        print("⚠️ No job results found in analysis output.")
+        return send_bulk_to_api(job_results)
+    print("⚠️ No job results found in analysis output.")
+    return True
 
 
-print("Ready to receive messages...")
+def analyze_batch(batch: list) -> bool:
+    return analyze_and_send([job for _, job in batch])
 
-for message in pubsub.listen():
-    if message["type"] != "message":
-        continue
 
-    raw_data = message["data"]
-    if isinstance(raw_data, bytes):
-        raw_data = raw_data.decode("utf-8")
+def batch_done(batch: list, succeeded: bool) -> None:
+    """
+    Acknowledge a batch only if it went through.
+    Unacknowledged jobs stay pending and are reclaimed after JOBS_RECLAIM_IDLE_MS.
+    """
+    entry_ids = [entry_id for entry_id, _ in batch]
+    if succeeded:
+        job_stream.ack(entry_ids)
+    in_progress_ids.difference_update(entry_ids)
+    print(f"📊 Analysis pool: {analysis_pool.stats()}, cache: {analysis_cache.stats()}")
 
-    try:
-        job_data = json.loads(raw_data)
+
+analysis_pool = AnalysisPool(analyze_batch, ANALYSIS_CONCURRENCY, ANALYSIS_MAX_QUEUED)
+
+
+def flush_due_batches() -> None:
+    """
+    Hand every due batch to the analysis pool; blocks while the pool is saturated.
+    """
+    while batch := batcher.next_batch(workers_free=analysis_pool.has_idle_worker()):
+        in_progress_ids.update(entry_id for entry_id, _ in batch)
+        analysis_pool.submit(batch, batch_done)
+
+
+pubsub = r.pubsub(ignore_subscribe_messages=True)
+pubsub.subscribe(**{USER_SKILLS_UPDATED_CHANNEL: lambda message: invalidate_tech_stacks(
+    message["data"].decode("utf-8") if isinstance(message["data"], bytes) else message["data"])})
+pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+start_http_server(metrics.METRICS_PORT)
+job_stream.ensure_group()
+print(f"Ready to receive job offers as {CONSUMER_NAME}...")
+
+while True:
+    # Pick up work that crashed or stalled consumers left behind before reading new entries
+    wanted = BATCH_MAX_SIZE - len(batcher)
+    held = batcher.entry_ids() | set(in_progress_ids)
+    # Wake up in time for the oldest buffered job's deadline
+    due_in = batcher.seconds_until_due()
+    block_ms = READ_BLOCK_MS if due_in is None else max(1, min(READ_BLOCK_MS, int(due_in * 1000)))
+    entries = job_stream.reclaim(wanted, exclude=held) or job_stream.read(wanted, block_ms)
+
+    for entry_id, job_data in entries:
         if "full_text" in job_data:
-            job_buffer.append(job_data)
-            print(f"📥 Job offer received ({len(job_buffer)}/{BUFFER_SIZE})")
+            batcher.add(entry_id, job_data)
+            print(f"📥 Job offer received ({len(batcher)} buffered)")
         else:
             print("⚠️ Job offer missing 'full_text' field")
+            job_stream.ack([entry_id])
 
-    except json.JSONDecodeError:
-        print("Invalid JSON:", raw_data)
-
-    # Analyze and POST every BUFFER_SIZE jobs
-    if len(job_buffer) >= BUFFER_SIZE:
-        analyze_and_send(job_buffer)
-        job_buffer.clear()
+    flush_due_batches()
@@ -0,0 +1,57 @@
+"""
+Measure SkillMatcher throughput on a corpus of job descriptions.
+
+    python matcher_benchmark.py [--megabytes 8] [--source ../../job_offers_high_match_fit_descriptions.csv]
+
+The corpus repeats the sample offers' titles and descriptions, each copy
+shuffled by sentence, until it reaches ``--megabytes``. Reports documents and
+megabytes per second for ``SkillMatcher.score`` against a fixed stack.
+"""
+import argparse
+import csv
+import os
+import random
+import time
+
+from skill_matcher import SkillMatcher
+
+DEFAULT_SOURCE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "job_offers_high_match_fit_descriptions.csv"
+)
+TECH_STACK = ["Python", "FastAPI", "PostgreSQL", "Docker", "React", "Go"]
+
+
+def build_corpus(source: str, megabytes: float) -> list[str]:
+    with open(source, "r", encoding="utf-8") as f:
+        offers = [f"{row['title']}\n{row['description']}" for row in csv.DictReader(f)]
+    rng = random.Random(0)
+    corpus, size = [], 0
+    while size < megabytes * 1024 * 1024:
+        sentences = rng.choice(offers).split(". ")
+        rng.shuffle(sentences)
+        corpus.append(". ".join(sentences))
+        size += len(corpus[-1].encode("utf-8"))
+    return corpus
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=8)
+    parser.add_argument("--source", default=DEFAULT_SOURCE)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.source, args.megabytes)
+    size_mb = sum(len(doc.encode("utf-8")) for doc in corpus) / (1024 * 1024)
+
+    start = time.perf_counter()
+    matcher = SkillMatcher.from_catalog()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    matched = sum(matcher.score(doc, TECH_STACK) > 0 for doc in corpus)
+    elapsed = time.perf_counter() - start
+    print(f"automaton built in {build_ms:.1f} ms")
+    print(
+        f"{len(corpus)} docs, {size_mb:.1f} MB: {len(corpus) / elapsed:,.0f} docs/s, "
+        f"{size_mb / elapsed:.1f} MB/s, {elapsed / len(corpus) * 1e6:.1f} µs/doc, {matched} with a matching skill"
+    )
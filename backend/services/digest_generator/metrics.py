@@ -0,0 +1,45 @@
+"""
+Prometheus metrics for the digest generator.
+
+Served in text format on ``METRICS_PORT`` by ``prometheus_client``'s own HTTP
+server (see ``main``).
+"""
+import os
+
+from prometheus_client import Counter, Histogram
+
+METRICS_PORT = int(os.getenv("METRICS_PORT", 9101))
+
+BATCH_SIZE = Histogram(
+    "digest_batch_size",
+    "Jobs per analysis batch",
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55),
+)
+BATCH_TOKENS = Histogram(
+    "digest_batch_tokens",
+    "Estimated prompt tokens of the jobs in an analysis batch",
+    buckets=(500, 1_000, 2_000, 4_000, 8_000, 16_000, 32_000),
+)
+JOB_BATCH_WAIT = Histogram(
+    "digest_job_batch_wait_seconds",
+    "Time a job spent buffered before its batch was cut",
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+BATCH_FLUSHES = Counter(
+    "digest_batch_flushes_total",
+    "Analysis batches cut, by the rule that cut them",
+    ["reason"],
+)
+PRESCORED_JOBS = Counter(
+    "digest_prescored_jobs_total",
+    "Jobs checked by the local skill pre-scorer, by whether they went on to the model",
+    ["outcome"],
+)
+ANALYSIS_CACHE_HITS = Counter(
+    "digest_analysis_cache_hits_total",
+    "Jobs whose analysis was served from the analysis cache",
+)
+ANALYSIS_CACHE_MISSES = Counter(
+    "digest_analysis_cache_misses_total",
+    "Jobs looked up in the analysis cache and not found",
+)
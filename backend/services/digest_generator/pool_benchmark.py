@@ -0,0 +1,55 @@
+"""
+Measure analysis throughput of AnalysisPool against a stub LLM.
+
+    python pool_benchmark.py [--latency 0.2] [--batches 32] [--concurrency 1,2,4,8,16] [--limit 8]
+
+Each batch sleeps ``--latency`` seconds, like a model call dominated by
+network wait. Throughput should grow almost linearly with concurrency and
+flatten once it reaches ``--limit`` (the pool size being evaluated).
+"""
+import argparse
+import threading
+import time
+
+from worker_pool import AnalysisPool
+
+
+def stub_llm(latency: float):
+    def analyze(batch) -> bool:
+        time.sleep(latency)
+        return True
+    return analyze
+
+
+def run(concurrency: int, latency: float, batches: int) -> float:
+    pool = AnalysisPool(stub_llm(latency), concurrency, max_queued=concurrency)
+    done = threading.Semaphore(0)
+    start = time.perf_counter()
+    for i in range(batches):
+        pool.submit(i, lambda batch, ok: done.release())
+    for _ in range(batches):
+        done.acquire()
+    elapsed = time.perf_counter() - start
+    stats = pool.stats()
+    pool.shutdown()
+    assert stats["completed"] == batches, stats
+    return batches / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--batches", type=int, default=32)
+    parser.add_argument("--concurrency", default="1,2,4,8,16")
+    parser.add_argument("--limit", type=int, default=8)
+    args = parser.parse_args()
+
+    baseline = None
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        workers = min(concurrency, args.limit)
+        throughput = run(workers, args.latency, args.batches)
+        baseline = baseline or throughput
+        print(
+            f"requested={concurrency:<3} workers={workers:<3} "
+            f"{throughput:7.2f} batches/s  speedup={throughput / baseline:5.2f}x  ideal={workers:>2}x"
+        )
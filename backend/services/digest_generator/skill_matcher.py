@@ -0,0 +1,126 @@
+"""
+Local skill matching used to pre-score job offers before the LLM.
+
+Every catalog skill (``skills_only.json``, the seed of ``models.Skill``) and
+its aliases go into one Aho-Corasick automaton, so a single pass over an
+offer's text finds all of them regardless of how many skills there are.
+Matches must sit on word boundaries, and the bare names in
+``CASE_SENSITIVE_NAMES`` that double as English words ("Go", "Swift", ...)
+only count when written with their capital letter. Single-letter names
+("R") would fire on every occurrence of the letter inside the automaton, so
+they are matched with a regular expression instead.
+"""
+import json
+import os
+import re
+
+import ahocorasick
+
+SKILLS_CATALOG_PATH = os.getenv(
+    "SKILLS_CATALOG_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "skills_only.json"),
+)
+
+# Other spellings of catalog skills, keyed by catalog name
+SKILL_ALIASES = {
+    "Python": ["python3"],
+    "JavaScript": ["js", "ecmascript", "es6"],
+    "C#": ["csharp", "c sharp"],
+    "C++": ["cpp"],
+    "Go": ["golang"],
+    "React": ["reactjs", "react.js"],
+    "Angular": ["angularjs"],
+    "Vue.js": ["vue", "vuejs"],
+    "Sass": ["scss"],
+    "Tailwind CSS": ["tailwind", "tailwindcss"],
+    "Next.js": ["nextjs"],
+    "Node.js": ["node", "nodejs"],
+    "Express.js": ["expressjs"],
+    "Spring Boot": ["spring"],
+    ".NET Core": [".net", "dotnet", "asp.net"],
+    "Ruby on Rails": ["rails", "ror"],
+    "Koa.js": ["koa"],
+    "PostgreSQL": ["postgres", "psql"],
+    "MongoDB": ["mongo"],
+    "Oracle Database": ["oracle"],
+    "Microsoft SQL Server": ["sql server", "mssql", "t-sql"],
+    "Kubernetes": ["k8s"],
+    "AWS": ["amazon web services"],
+    "Azure": ["microsoft azure"],
+    "Google Cloud Platform": ["google cloud", "gcp"],
+    "GitLab CI/CD": ["gitlab ci", "gitlab"],
+    "React Native": ["react-native"],
+    "Android SDK": ["android"],
+    "iOS SDK": ["ios"],
+    "REST APIs": ["rest api", "restful"],
+    "WebSockets": ["websocket"],
+    "Agile/Scrum": ["agile", "scrum"],
+    "Bash/Shell Scripting": ["bash", "shell scripting"],
+    "UI/UX Design": ["ui/ux", "ux"],
+    "Machine Learning": ["ml"],
+    "Data Analysis": ["data analytics"],
+    "NLP": ["natural language processing"],
+}
+# Names that are also common words, matched only as written in the catalog
+CASE_SENSITIVE_NAMES = {"Go", "R", "Swift", "Rust", "Jest", "Mocha", "Jasmine", "Flask"}
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _lower_in_place(text: str) -> str:
+    """``text.lower()`` with offsets kept: characters such as "İ" that lowercase
+    to more than one character are left as they are."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(low if len(low := char.lower()) == 1 else char for char in text)
+
+
+class SkillMatcher:
+    def __init__(self, skill_names: list[str], aliases: dict[str, list[str]] = SKILL_ALIASES):
+        self._automaton = ahocorasick.Automaton()
+        patterns = {}  # lowercased pattern -> [(skill, spelling that must match exactly, or None)]
+        letters = []
+        for name in skill_names:
+            if len(name) == 1:
+                letters.append(name)
+                continue
+            exact = name if name in CASE_SENSITIVE_NAMES else None
+            patterns.setdefault(name.lower(), []).append((name, exact))
+            for alias in aliases.get(name, []):
+                patterns.setdefault(alias.lower(), []).append((name, None))
+        for pattern, skills in patterns.items():
+            self._automaton.add_word(pattern, (pattern, tuple(skills)))
+        self._automaton.make_automaton()
+        self._letters = re.compile(rf"(?<!\w)[{''.join(map(re.escape, letters))}](?![\w&])") if letters else None
+        self.skills = frozenset(skill_names)
+
+    @classmethod
+    def from_catalog(cls, path: str = SKILLS_CATALOG_PATH) -> "SkillMatcher":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls([skill["name"] for skill in json.load(f)["skills"]])
+
+    def find(self, text: str) -> set[str]:
+        """Catalog names of the skills mentioned in ``text``."""
+        found = set(self._letters.findall(text)) if self._letters else set()
+        lowered = _lower_in_place(text)
+        for end, (pattern, skills) in self._automaton.iter(lowered):
+            start = end - len(pattern) + 1
+            if _is_word_char(pattern[0]) and start > 0 and _is_word_char(lowered[start - 1]):
+                continue
+            if _is_word_char(pattern[-1]) and end + 1 < len(lowered) and _is_word_char(lowered[end + 1]):
+                continue
+            for name, exact in skills:
+                if exact is None or text[start:end + 1] == exact:
+                    found.add(name)
+        return found
+
+    def score(self, text: str, tech_stack: list[str]) -> int:
+        """Number of the user's skills mentioned in ``text``."""
+        return len(self.find(text).intersection(tech_stack))
+
+    def knows(self, tech_stack: list[str]) -> bool:
+        """True when every skill of the stack is in the catalog, so a score of 0 is meaningful."""
+        return self.skills.issuperset(tech_stack)
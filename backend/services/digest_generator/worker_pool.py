@@ -0,0 +1,68 @@
+"""
+Bounded worker pool for LLM analysis batches.
+
+``analyze_job`` blocks for seconds per call, so batches run on worker threads
+while the main loop keeps reading the stream. At most ``concurrency`` batches
+run at once and at most ``max_queued`` more wait for a worker; beyond that
+``submit`` blocks, which stops intake instead of buffering without bound
+(unread entries simply stay in the stream).
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class AnalysisPool:
+    def __init__(self, handler: Callable[[Any], bool], concurrency: int, max_queued: int):
+        self.handler = handler
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="analysis")
+        self._slots = threading.BoundedSemaphore(concurrency + max_queued)
+        self._lock = threading.Lock()
+        self._counts = {"queued": 0, "in_flight": 0, "completed": 0, "failed": 0}
+
+    def submit(self, batch: Any, on_done: Callable[[Any, bool], None]) -> None:
+        """Run ``handler(batch)`` on a worker, then ``on_done(batch, succeeded)``.
+
+        Blocks while the pool is saturated.
+        """
+        self._slots.acquire()
+        self._count(queued=1)
+        self._executor.submit(self._run, batch, on_done)
+
+    def _run(self, batch: Any, on_done: Callable[[Any, bool], None]) -> None:
+        self._count(queued=-1, in_flight=1)
+        succeeded = False
+        try:
+            succeeded = bool(self.handler(batch))
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"Analysis worker failed: {e}")
+        finally:
+            self._count(in_flight=-1, completed=int(succeeded), failed=int(not succeeded))
+            self._slots.release()
+        on_done(batch, succeeded)
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                self._counts[name] += delta
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def has_idle_worker(self) -> bool:
+        with self._lock:
+            return not self._counts["queued"] and self._counts["in_flight"] < self.concurrency
+
+    def wait_idle(self, poll_seconds: float = 0.01) -> None:
+        """Block until nothing is queued or in flight."""
+        while True:
+            stats = self.stats()
+            if not stats["queued"] and not stats["in_flight"]:
+                return
+            time.sleep(poll_seconds)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
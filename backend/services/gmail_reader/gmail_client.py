@@ -1,36 +1,24 @@
 import json
 from urllib import response
-import requests
 from datetime import datetime
 import os
+import sys
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from service_auth.client import ServiceClient
+
 SERVICE_NAME = "gmail_service"
 SERVICE_SECRET = "gmail_secret"
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
-CREDENTIAL_ENDPOINT = 'http://localhost:8000/google-creds/all'
-SERVICE_TOKEN_ENDPOINT = 'http://localhost:8001/auth/token'
+CREDENTIAL_ENDPOINT = 'http://localhost:8000/service/google-creds/all'
 
-def get_service_auth_token():
-    """
-    Retrieves the service auth token from environment variables or a config file.
-    """
-    response = requests.post(SERVICE_TOKEN_ENDPOINT, json={
-        "service_name": SERVICE_NAME,
-        "service_secret": SERVICE_SECRET
-    })
-    if response.status_code == 200:
-        return response.json().get("access_token")
-    raise Exception("Failed to retrieve service auth token")
+api = ServiceClient(SERVICE_NAME, SERVICE_SECRET)
 
 def load_credentials() -> dict:
-    service_token = get_service_auth_token()
-    headers = {
-        "Authorization": f"Bearer {service_token}"
-    }
-    response = requests.get(CREDENTIAL_ENDPOINT, headers=headers)
+    response = api.get(CREDENTIAL_ENDPOINT)
     if response.status_code == 200:
         return response.json()
     return {}
@@ -7,6 +7,10 @@ load_dotenv()
 
 r = redis.Redis(host=os.getenv("REDIS_HOST", "localhost"), port=6379, db=0)
 
+JOBS_STREAM = os.getenv("JOBS_STREAM", "jobs")
+# Approximate cap so an idle consumer group cannot grow the stream without bound
+JOBS_STREAM_MAXLEN = int(os.getenv("JOBS_STREAM_MAXLEN", 100_000))
+
 def publish_job(job_data: dict):
     message = json.dumps(job_data)
-    r.publish('jobs', message)
+    r.xadd(JOBS_STREAM, {"data": message}, maxlen=JOBS_STREAM_MAXLEN, approximate=True)
@@ -0,0 +1,111 @@
+"""
+HTTP client for worker services calling the API with a service token.
+
+Tokens from the auth service are valid for an hour, so the client caches one
+until shortly before its ``exp`` and renews it in a background thread ahead of
+expiry. Requests share one pooled keep-alive ``requests.Session``, and a 401
+(e.g. after the auth secret rotates) fetches a new token and retries once.
+"""
+import base64
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SERVICE_TOKEN_ENDPOINT = os.getenv("SERVICE_TOKEN_ENDPOINT", "http://localhost:8001/auth/token")
+# Renew this many seconds before the token expires
+TOKEN_REFRESH_MARGIN_SECONDS = float(os.getenv("SERVICE_TOKEN_REFRESH_MARGIN_SECONDS", 60))
+# Used when a token carries no readable ``exp`` claim
+DEFAULT_TOKEN_TTL_SECONDS = 300
+HTTP_POOL_SIZE = int(os.getenv("SERVICE_HTTP_POOL_SIZE", 10))
+
+
+def token_expiry(token: str) -> float:
+    """Return the ``exp`` claim of a JWT as a unix timestamp, without verifying it."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + DEFAULT_TOKEN_TTL_SECONDS
+
+
+class ServiceClient:
+    """Authenticated, pooled HTTP client for one worker service."""
+
+    def __init__(self, service_name: str, service_secret: str, token_endpoint: str = SERVICE_TOKEN_ENDPOINT):
+        self.service_name = service_name
+        self.service_secret = service_secret
+        self.token_endpoint = token_endpoint
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._token = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_timer = None
+
+    def get_token(self) -> str:
+        """Return the cached token, fetching a new one when it is about to expire."""
+        with self._lock:
+            if self._token is None or time.time() >= self._expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+                self._fetch_token()
+            return self._token
+
+    def invalidate_token(self) -> None:
+        with self._lock:
+            self._token = None
+
+    def _fetch_token(self) -> None:
+        response = self.session.post(self.token_endpoint, json={
+            "service_name": self.service_name,
+            "service_secret": self.service_secret
+        }, timeout=10)
+        if response.status_code != 200:
+            raise Exception("Failed to retrieve service auth token")
+        self._token = response.json().get("access_token")
+        self._expires_at = token_expiry(self._token)
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        delay = max(self._expires_at - TOKEN_REFRESH_MARGIN_SECONDS - time.time(), 0) + 1
+        self._refresh_timer = threading.Timer(delay, self._refresh_in_background)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.get_token()
+        except Exception as e:
+            # The next request retries the fetch in the foreground
+            print(f"Background service token refresh failed: {e}")
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with the service token, retrying once on 401."""
+        kwargs.setdefault("timeout", 10)
+        headers = kwargs.pop("headers", None) or {}
+        for attempt in range(2):
+            response = self.session.request(
+                method, url, headers={**headers, "Authorization": f"Bearer {self.get_token()}"}, **kwargs
+            )
+            if response.status_code != 401 or attempt:
+                return response
+            self.invalidate_token()
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self.session.close()
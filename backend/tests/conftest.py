@@ -0,0 +1,69 @@
+"""
+Shared fixtures: the API on an in-memory SQLite database built from the models.
+
+Run from the ``backend`` directory with ``python -m pytest``.
+"""
+import logging
+import os
+
+os.environ.setdefault("ALLOWED_HOSTS", "testserver")
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app import metrics, models
+from app.database import Base, get_db
+from app.main import app
+from app.routes.routes import get_current_user, get_read_db
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    metrics.instrument_engine(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+@pytest.fixture
+async def user(session_factory):
+    user = models.User(id=1, email="user@example.com", hashed_password="x", is_active=True, is_verified=True)
+    async with session_factory() as session:
+        async with session.begin():
+            session.add(user)
+    return user
+
+
+@pytest.fixture
+async def client(session_factory, user):
+    async def override_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_read_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    logging.disable(logging.CRITICAL)
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            yield client
+    finally:
+        logging.disable(logging.NOTSET)
+        app.dependency_overrides.clear()
@@ -0,0 +1,31 @@
+"""
+Key normalization of the digest generator's analysis cache.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "services", "digest_generator"))
+
+import analysis_cache  # noqa: E402
+
+STACK = ["Python"]
+
+
+def key(text):
+    return analysis_cache.cache_key(text, STACK, "v1")
+
+
+@pytest.mark.parametrize("tracked, clean", [
+    ("Apply: https://jobs.example/42?utm_source=mail&id=3", "Apply: https://jobs.example/42?id=3"),
+    ("Apply: https://jobs.example/42?id=3&trk=digest&fbclid=x", "Apply: https://jobs.example/42?id=3"),
+    ("Apply: https://jobs.example/42?utm_medium=email", "Apply: https://jobs.example/42"),
+])
+def test_tracking_params_do_not_change_the_key(tracked, clean):
+    assert key(tracked) == key(clean)
+
+
+def test_other_query_params_still_change_the_key():
+    assert key("https://jobs.example/42?id=3") != key("https://jobs.example/42?id=4")
+    assert key("https://jobs.example/42?id=3") != key("https://jobs.example/42")
@@ -0,0 +1,63 @@
+"""
+Merging behaviour of ``POST /service/job_offers/bulk_create``.
+"""
+import pytest
+from sqlalchemy import select
+
+from app import models
+from services.service_auth.utils import create_jwt_token
+
+pytestmark = pytest.mark.anyio
+
+OFFER = {
+    "user_id": 1,
+    "match_score": 0.8,
+    "title": "Backend Engineer",
+    "company": "Acme",
+    "location": "Remote",
+    "apply_link": "https://acme.example/jobs/1",
+}
+
+
+@pytest.fixture
+def service_headers():
+    return {"Authorization": f"Bearer {create_jwt_token('digest_generator')}"}
+
+
+async def bulk_create(client, headers, *offers):
+    response = await client.post("/service/job_offers/bulk_create", json={"job_offers": list(offers)}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def test_merge_replaces_skill_links_and_keeps_email(client, session_factory, service_headers):
+    async with session_factory() as session:
+        async with session.begin():
+            session.add_all([models.Skill(id=1, name="Python"), models.Skill(id=2, name="Docker")])
+
+    first = await bulk_create(
+        client, service_headers, {**OFFER, "email": "jobs@acme.example", "technologies_matched": "Python, Docker"}
+    )
+    second = await bulk_create(client, service_headers, {**OFFER, "technologies_matched": "Python"})
+    assert (first["inserted"], second["merged"]) == (1, 1)
+
+    async with session_factory() as session:
+        offer = (await session.scalars(select(models.JobOffer))).one()
+        assoc = models.job_offer_skill_association
+        linked = (await session.scalars(select(assoc.c.skill_id).where(assoc.c.job_offer_id == offer.id))).all()
+
+    assert offer.email == "jobs@acme.example"
+    assert offer.technologies_matched == "Python"
+    assert linked == [1]
+
+
+async def test_merge_changes_the_feed_etag(client, service_headers, user):
+    await bulk_create(client, service_headers, {**OFFER, "reason": "Python backend"})
+    first = await client.get("/job-offers")
+    etag = first.headers["ETag"]
+    assert (await client.get("/job-offers", headers={"If-None-Match": etag})).status_code == 304
+
+    await bulk_create(client, service_headers, {**OFFER, "reason": "Python and Go backend"})
+    second = await client.get("/job-offers", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.json()["results"][0]["reason"] == "Python and Go backend"
@@ -0,0 +1,58 @@
+"""
+Filters of ``GET /job-offers``: timezone-aware ``since`` values and literal
+``%``/``_`` in substring filters.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app import models
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def offers(session_factory, user):
+    rows = [
+        ("Old", "Acme", datetime(2024, 12, 31, 23, 0)),
+        ("New", "100% Remote Co", datetime(2025, 1, 1, 1, 0)),
+        ("Newer", "Data_Works", datetime(2025, 1, 2, 0, 0)),
+        ("Newest", "DataXWorks", datetime(2025, 1, 3, 0, 0)),
+    ]
+    async with session_factory() as session:
+        async with session.begin():
+            session.add_all(
+                models.JobOffer(user_id=user.id, title=title, company=company, created_at=created_at)
+                for title, company, created_at in rows
+            )
+
+
+async def titles(client, **params) -> list[str]:
+    response = await client.get("/job-offers", params={"limit": 10, **params})
+    assert response.status_code == 200, response.text
+    return [offer["title"] for offer in response.json()["results"]]
+
+
+@pytest.mark.parametrize("since", ["2025-01-01T00:00:00Z", "2025-01-01T02:00:00+02:00", "2025-01-01T00:00:00"])
+async def test_since_accepts_aware_and_naive_values(client, offers, since):
+    assert await titles(client, since=since) == ["Newest", "Newer", "New"]
+
+
+async def test_substring_filters_match_wildcards_literally(client, offers):
+    assert await titles(client, company="%") == ["New"]
+    assert await titles(client, company="a_w") == ["Newer"]
+
+
+async def test_skill_stats_since_accepts_aware_values(client, session_factory, offers):
+    async with session_factory() as session:
+        async with session.begin():
+            session.add(models.Skill(id=1, name="Python"))
+            for offer in (await session.scalars(select(models.JobOffer))).all():
+                await session.execute(
+                    models.job_offer_skill_association.insert().values(job_offer_id=offer.id, skill_id=1)
+                )
+
+    response = await client.get("/job-offers/skill-stats", params={"since": "2025-01-01T02:00:00+02:00"})
+    assert response.status_code == 200, response.text
+    assert [(s["name"], s["offer_count"]) for s in response.json()] == [("Python", 3)]
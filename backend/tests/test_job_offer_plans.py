@@ -0,0 +1,50 @@
+"""
+The per-user job offer listing must be served by ``ix_job_offers_user_id_created_at_id``.
+
+The statement is captured from a real ``GET /job-offers`` request and
+explained on SQLite, so the test follows whatever query the endpoint builds.
+"""
+import random
+
+import pytest
+from sqlalchemy import event, text
+
+from app import models
+from benchmarks.common import synthetic_offer
+
+LISTING_INDEX = "ix_job_offers_user_id_created_at_id"
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_listing_uses_user_created_at_index(client, engine, session_factory):
+    rng = random.Random(0)
+    async with session_factory() as session:
+        async with session.begin():
+            session.add(models.User(id=2, email="other@example.com", hashed_password="x"))
+            session.add_all(models.JobOffer(**synthetic_offer(rng, user_id=1 + i % 2)) for i in range(200))
+        await session.execute(text("ANALYZE"))
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "ORDER BY" in statement.upper():
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        response = await client.get("/job-offers?limit=20")
+        first_page = response.json()
+        await client.get("/job-offers", params={"limit": 20, "cursor": first_page["next"].split("cursor=")[1]})
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert len(statements) == 2  # first page and the page after the cursor
+
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plan = " | ".join(row[-1] for row in result.all())
+            assert LISTING_INDEX in plan, plan
+            assert "TEMP B-TREE" not in plan, plan
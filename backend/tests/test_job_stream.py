@@ -0,0 +1,91 @@
+"""
+Consumer-group behaviour of the digest generator's ``jobs`` stream, against fakeredis.
+"""
+import json
+import os
+import sys
+import time
+
+import fakeredis
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "services", "digest_generator"))
+
+import job_stream  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeRedis()
+
+
+def stream_for(client, consumer):
+    stream = job_stream.JobStream(client, consumer, stream="jobs", group="digest_generator")
+    stream.ensure_group()
+    return stream
+
+
+def add_jobs(client, *titles):
+    return [client.xadd("jobs", {"data": json.dumps({"title": title})}) for title in titles]
+
+
+def stall():
+    """Let pending entries go idle; fakeredis only reports an idle time above ``min_idle_ms``."""
+    time.sleep(0.01)
+
+
+def titles(entries):
+    return sorted(job["title"] for _, job in entries)
+
+
+def test_group_fans_entries_out_to_one_consumer_each(client):
+    first, second = stream_for(client, "gen-1"), stream_for(client, "gen-2")
+    add_jobs(client, "a", "b", "c")
+
+    got_first = first.read(count=2, block_ms=0)
+    got_second = second.read(count=2, block_ms=0)
+
+    assert titles(got_first) == ["a", "b"]
+    assert titles(got_second) == ["c"]
+    assert second.read(count=2, block_ms=0) == []
+
+
+def test_stalled_entry_is_reclaimed_by_another_consumer(client):
+    crashed, survivor = stream_for(client, "gen-1"), stream_for(client, "gen-2")
+    add_jobs(client, "a", "b")
+    held = crashed.read(count=2, block_ms=0)
+    crashed.ack([held[0][0]])
+    stall()
+
+    reclaimed = survivor.reclaim(count=10, min_idle_ms=0)
+    assert [entry_id for entry_id, _ in reclaimed] == [held[1][0]]
+    assert titles(reclaimed) == ["b"]
+
+    survivor.ack([entry_id for entry_id, _ in reclaimed])
+    assert client.xpending("jobs", "digest_generator")["pending"] == 0
+
+
+def test_reclaim_skips_entries_the_consumer_still_holds(client):
+    stream = stream_for(client, "gen-1")
+    add_jobs(client, "a")
+    (entry_id, _), = stream.read(count=1, block_ms=0)
+    stall()
+
+    assert stream.reclaim(count=10, exclude={entry_id}, min_idle_ms=0) == []
+
+
+def test_entry_is_dead_lettered_after_max_deliveries(client, monkeypatch):
+    monkeypatch.setattr(job_stream, "MAX_DELIVERIES", 2)
+    stream = stream_for(client, "gen-1")
+    add_jobs(client, "poison")
+    (entry_id, _), = stream.read(count=1, block_ms=0)
+    stall()
+
+    assert titles(stream.reclaim(count=10, min_idle_ms=0)) == ["poison"]  # second delivery
+    stall()
+    assert stream.reclaim(count=10, min_idle_ms=0) == []
+
+    (_, fields), = client.xrange(job_stream.JOBS_DEAD_LETTER_STREAM)
+    assert fields[b"source_id"] == entry_id
+    assert json.loads(fields[b"data"]) == {"title": "poison"}
+    assert client.xpending("jobs", "digest_generator")["pending"] == 0
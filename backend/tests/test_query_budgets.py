@@ -0,0 +1,58 @@
+"""
+SQL statement budgets for the skills endpoints.
+
+Statements are counted by the ``QueryStats`` hooks that ``instrument_engine``
+installs and ``MetricsMiddleware`` reports per route, so an endpoint that
+starts issuing a query per row (lazy or explicit) goes over its budget no
+matter how many rows are seeded.
+"""
+import pytest
+from prometheus_client import REGISTRY
+
+from app import models
+from app.helpers import skills_cache
+
+USERS = 5
+SKILLS_PER_USER = 3
+
+# (path, route template, statements allowed)
+BUDGETS = [
+    ("/skills", "/skills", 2),  # catalog version + catalog, on a cold cache
+    ("/user_skills", "/user_skills", 2),  # user skills + their skills
+    ("/user_skill_stats", "/user_skill_stats", 1),
+    ("/user_skills/user/3", "/user_skills/user/{user_id}", 2),
+]
+
+pytestmark = pytest.mark.anyio
+
+
+def queries_observed(route: str) -> tuple[float, float]:
+    labels = {"method": "GET", "route": route}
+    return (
+        REGISTRY.get_sample_value("http_request_db_queries_count", labels) or 0.0,
+        REGISTRY.get_sample_value("http_request_db_queries_sum", labels) or 0.0,
+    )
+
+
+@pytest.fixture
+async def seeded(session_factory, user):
+    async with session_factory() as session:
+        async with session.begin():
+            skills = [models.Skill(id=i, name=f"Skill {i}") for i in range(1, USERS * SKILLS_PER_USER + 1)]
+            session.add_all(skills)
+            for user_id in range(2, USERS + 2):
+                session.add(models.User(id=user_id, email=f"user{user_id}@example.com", hashed_password="x"))
+                offset = (user_id - 2) * SKILLS_PER_USER
+                session.add(models.UserSkill(user_id=user_id, skills=skills[offset:offset + SKILLS_PER_USER]))
+    skills_cache._catalog = None
+
+
+@pytest.mark.parametrize("path, route, budget", BUDGETS, ids=[path for path, _, _ in BUDGETS])
+async def test_endpoint_within_query_budget(client, seeded, path, route, budget):
+    count_before, sum_before = queries_observed(route)
+    response = await client.get(path)
+    count_after, sum_after = queries_observed(route)
+
+    assert response.status_code == 200, response.text
+    assert count_after == count_before + 1
+    assert sum_after - sum_before <= budget, f"{path} ran {sum_after - sum_before:.0f} statements, budget {budget}"
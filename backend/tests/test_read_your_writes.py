@@ -0,0 +1,44 @@
+"""
+Read-your-writes routing: a write recorded by one API process must pin the
+user's reads to the primary in every other process too.
+"""
+import fakeredis
+import pytest
+import redis
+
+from app import database, redis_client
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def shared_redis(monkeypatch):
+    client = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(redis_client, "redis_client", client)
+    monkeypatch.setattr(database, "replica_engine", object())  # pretend a replica is configured
+    database._recent_writers.clear()
+    yield client
+    database._recent_writers.clear()
+
+
+def other_process():
+    """Forget what this process saw locally, as a different worker would."""
+    database._recent_writers.clear()
+
+
+async def test_write_pins_reads_to_primary_across_processes(shared_redis):
+    await database.mark_user_write(7, None)
+    other_process()
+
+    assert await database.read_sessionmaker_for(7) is database.AsyncSessionLocal
+    assert await database.read_sessionmaker_for(8) is database.ReplicaSessionLocal
+    ttl_ms = await shared_redis.pttl(database.RECENT_WRITE_KEY.format(7))
+    assert 0 < ttl_ms <= database.DB_REPLICA_STICKY_SECONDS * 1000
+
+
+async def test_reads_use_primary_when_redis_is_down(shared_redis, monkeypatch):
+    async def unavailable(*args, **kwargs):
+        raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(shared_redis, "exists", unavailable)
+    assert await database.read_sessionmaker_for(8) is database.AsyncSessionLocal
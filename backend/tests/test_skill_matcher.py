@@ -0,0 +1,28 @@
+"""
+Local skill matching of the digest generator's pre-scorer.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "services", "digest_generator"))
+
+import skill_matcher  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return skill_matcher.SkillMatcher(["Go", "Swift", "Python", "R"])
+
+
+@pytest.mark.parametrize("text", [
+    "Backend role in Berlin: Go, Swift and Python",
+    "Backend role in İstanbul: Go, Swift and Python",  # "İ" lowercases to two characters
+])
+def test_case_sensitive_names_match_as_written(matcher, text):
+    assert matcher.find(text) == {"Go", "Swift", "Python"}
+
+
+def test_case_sensitive_names_ignore_common_words(matcher):
+    assert matcher.find("Ready to go? We move swiftly with python") == {"Python"}
@@ -0,0 +1,35 @@
+"""
+Invalidation of the in-process skills catalog cache.
+"""
+import json
+
+import pytest
+
+from app import models
+from app.helpers import skills_cache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    skills_cache._invalidate()
+    yield
+    skills_cache._invalidate()
+
+
+async def test_cache_is_dropped_only_after_the_writer_commits(session_factory):
+    async with session_factory() as session:
+        before = await skills_cache.get_skills_catalog(session)
+
+    async with session_factory() as session:
+        async with session.begin():
+            session.add(models.Skill(id=1, name="Python"))
+            await skills_cache.bump_skills_version(session)
+            assert skills_cache._catalog is before  # a reload here could still see the old rows
+
+    async with session_factory() as session:
+        after = await skills_cache.get_skills_catalog(session)
+
+    assert after.version == before.version + 1
+    assert json.loads(after.body) == [{"name": "Python", "id": 1}]
@@ -41,7 +41,7 @@ export default function HomeScreen() {
   const [error, setError] = React.useState<string | null>(null);
 
   const initialUrl = React.useMemo(() => {
-    const base = `/job-offers?limit=${PAGE_SIZE}&offset=0`;
+    const base = `/job-offers?limit=${PAGE_SIZE}&view=summary`;
     return user?.id ? `${base}&user=${user.id}` : base;
   }, [user?.id]);
 
@@ -60,7 +60,6 @@ export default function HomeScreen() {
         "job-offers",
         ["user", user?.id ?? null],
         ["limit", PAGE_SIZE],
-        ["offset", 0],
       ],
       enabled: Boolean(user?.id),
     }
@@ -13,11 +13,18 @@ import { ArrowLeft, MapPin } from "lucide-react-native";
 import { Pressable, ScrollView } from "react-native";
 import { useNavigation, useRoute } from "@react-navigation/native";
 import { Linking } from "react-native";
+import { useApi } from "../api/api";
 
 export default function JobDetailsScreen() {
   const navigation = useNavigation();
   const route = useRoute();
-  const { job } = route.params as { job: JobOffer };
+  const { job: summary } = route.params as { job: JobOffer };
+  // The feed only carries summary fields; load the full offer for the analysis and link
+  const detailQuery = useApi<JobOffer>(
+    { url: `/job-offers/${summary.id}`, options: { method: "GET" } },
+    { queryKey: ["job-offers", ["id", summary.id]] }
+  );
+  const job = detailQuery.data ?? summary;
 
   return (
       <Box flex={1} bg="$black" px="$5" pt="$12">
@@ -77,7 +84,8 @@ export default function JobDetailsScreen() {
             bg="$blue600"
             mt="$8"
             borderRadius="$lg"
-            onPress={() => Linking.openURL(job.apply_link)}
+            isDisabled={!job.apply_link}
+            onPress={() => job.apply_link && Linking.openURL(job.apply_link)}
           >
             <Text color="$white" fontWeight="$bold" fontSize="$md">
               Apply Now